@@ -8,7 +8,9 @@ and directs users to the full application.
 import streamlit as st
 from pathlib import Path
 import base64
+import os
 import sys
+import uuid
 
 # Add src to path for demo client
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -21,6 +23,8 @@ except ImportError as e:
     DEMO_AVAILABLE = False
     print(f"Demo client not available: {e}")
 
+from payload_budget import PayloadMeter, ResponseStore
+
 # The main Minerva app is at claude_agent_new_v11
 MINERVA_APP_URL = "https://minerva.x-trillion.com"
 
@@ -32,8 +36,36 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Per-rerun payload accounting - set DEMO_PAYLOAD_REPORT=1 to show the report
+SHOW_PAYLOAD_REPORT = os.environ.get("DEMO_PAYLOAD_REPORT") == "1"
+payload_meter = PayloadMeter(st.session_state.get("payload_hashes"))
+
+
+def show_html(label, html):
+    """Render raw HTML and record its size under label in the payload meter"""
+    st.markdown(payload_meter.record(label, html), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_response_store():
+    """Server-wide store of demo responses, shared by all sessions"""
+    return ResponseStore()
+
+
+def render_payload_report(response_store):
+    """Show which elements dominated the bytes sent on this rerun"""
+    with st.expander("Payload report"):
+        st.caption(
+            f"This rerun: {payload_meter.total_bytes():,} bytes, "
+            f"{payload_meter.delta_bytes():,} bytes changed since last rerun"
+        )
+        st.dataframe(payload_meter.report(), use_container_width=True)
+        st.caption("Server response store")
+        st.json(response_store.stats())
+
+
 # Custom CSS for dark, modern aesthetic
-st.markdown("""
+show_html("global css", """
 <style>
     /* Hide Streamlit elements */
     #MainMenu {visibility: hidden;}
@@ -219,7 +251,7 @@ st.markdown("""
     }
 
 </style>
-""", unsafe_allow_html=True)
+""")
 
 
 def get_image_base64(image_path):
@@ -255,9 +287,11 @@ def main():
     # Video served from Cloudflare R2 CDN for fast loading
     minerva_video = "https://assets.x-trillion.com/minerva-welcome.mp4"
 
-    # Track demo response (replaces video)
-    if "demo_response" not in st.session_state:
-        st.session_state.demo_response = None
+    # Demo responses (which replace the video) are held server-side in the
+    # response store so they count against the per-session and server limits
+    response_store = get_response_store()
+    if "session_key" not in st.session_state:
+        st.session_state.session_key = uuid.uuid4().hex
     if "pending_query" not in st.session_state:
         st.session_state.pending_query = None
 
@@ -274,7 +308,7 @@ def main():
     ]
 
     # Mini agent card styling
-    st.markdown("""
+    show_html("agent card css", """
     <style>
         .agent-card-mini {
             background: rgba(255, 255, 255, 0.05);
@@ -309,7 +343,7 @@ def main():
             object-fit: contain !important;
         }
     </style>
-    """, unsafe_allow_html=True)
+    """)
 
     # Hero Section - Image/Chart (left) + Title & Agents (right)
     col_left, col_right = st.columns([1, 1])
@@ -320,16 +354,17 @@ def main():
             query = st.session_state.pending_query
             st.session_state.pending_query = None
             with st.spinner("Fetching data..."):
-                text, chart_html, agent_name = get_demo_response(query)
-            st.session_state.demo_response = (text, chart_html, agent_name, query)
+                text, chart_html, agent_name, tier = get_demo_response(query)
+            response_store.put(st.session_state.session_key, (text, chart_html, agent_name, query))
             st.rerun()
 
         # Show chart if we have a response, otherwise show Minerva image
-        if st.session_state.demo_response:
-            text, chart_html, agent_name, query = st.session_state.demo_response
+        demo_response = response_store.get(st.session_state.session_key)
+        if demo_response:
+            text, chart_html, agent_name, query = demo_response
 
             # Compact response display
-            st.markdown(f"""
+            show_html("response summary", f"""
             <div style="background: rgba(102, 126, 234, 0.2); padding: 8px 12px; border-radius: 8px; margin-bottom: 5px;">
                 <strong style="color: #667eea;">You:</strong>
                 <span style="color: #fff;"> {query}</span>
@@ -338,22 +373,22 @@ def main():
                 <strong style="color: #888;">{agent_name}:</strong>
                 <span style="color: #ccc; font-size: 0.85rem;">{text.split(chr(10))[0][:100]}...</span>
             </div>
-            """, unsafe_allow_html=True)
+            """)
 
             # Chart
             if chart_html:
-                st.components.v1.html(chart_html, height=380)
+                st.components.v1.html(payload_meter.record("chart iframe", chart_html), height=380)
         else:
             # Show Minerva video from R2 CDN
             st.video(minerva_video, autoplay=True, loop=True, muted=True)
 
     with col_right:
-        st.markdown("""
+        show_html("title", """
         <div style="padding: 5px 0;">
             <h1 style="font-size: 2rem; font-weight: 700; background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin: 0 0 5px 0;">MINERVA</h1>
             <p style="color: #888; font-size: 0.85rem; margin: 0 0 10px 0;">AI-Powered Financial Intelligence from X-Trillion</p>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
         # Agents grid 4x2
         for row in range(2):
@@ -362,10 +397,10 @@ def main():
                 agent_idx = row * 4 + i
                 if agent_idx < len(agents):
                     with col:
-                        st.markdown(render_agent_card(agents[agent_idx], assets_dir), unsafe_allow_html=True)
+                        show_html(f"agent card: {agents[agent_idx]['name']}", render_agent_card(agents[agent_idx], assets_dir))
 
         # Spacing before chat input
-        st.markdown("<div style='height: 20px'></div>", unsafe_allow_html=True)
+        show_html("spacer", "<div style='height: 20px'></div>")
 
         # Chat input under agents
         prompt = st.chat_input("Try: 'Show me US inflation' or 'What's the unemployment rate?'", key="chat_main")
@@ -375,53 +410,53 @@ def main():
                 st.rerun()
 
     # Capabilities Section
-    st.markdown('<h2 style="font-size: 1.6rem; font-weight: 700; color: #fff; text-align: center; margin: 15px 0 15px 0;">What Minerva Can Do</h2>', unsafe_allow_html=True)
+    show_html("capabilities header", '<h2 style="font-size: 1.6rem; font-weight: 700; color: #fff; text-align: center; margin: 15px 0 15px 0;">What Minerva Can Do</h2>')
 
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown("""
+        show_html("feature: queries", """
         <div class="feature-item">
             <div class="feature-title">Natural Language Queries</div>
             <div class="feature-desc">Ask questions in plain English. "What's US inflation?" or "Show me Brazil's GDP growth from IMF."</div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
-        st.markdown("""
+        show_html("feature: data sources", """
         <div class="feature-item">
             <div class="feature-title">Multi-Source Economic Data</div>
             <div class="feature-desc">Access data from FRED (US), IMF (190+ countries), World Bank (development indicators), and Net Foreign Assets.</div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
-        st.markdown("""
+        show_html("feature: charts", """
         <div class="feature-item">
             <div class="feature-title">Dynamic Chart Generation</div>
             <div class="feature-desc">Clara creates professional visualizations - line charts, bar charts, comparisons - tailored to your query.</div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
     with col2:
-        st.markdown("""
+        show_html("feature: fact-checking", """
         <div class="feature-item">
             <div class="feature-title">Political Fact-Checking</div>
             <div class="feature-desc">Polly analyzes political claims and provides fact-checked analysis with reliable sources.</div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
-        st.markdown("""
+        show_html("feature: reports", """
         <div class="feature-item">
             <div class="feature-title">Report Generation</div>
             <div class="feature-desc">Wren builds premium reports combining data, charts, and analysis into polished documents.</div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
-        st.markdown("""
+        show_html("feature: collaboration", """
         <div class="feature-item">
             <div class="feature-title">Agent Collaboration</div>
             <div class="feature-desc">Specialized agents work together - ask a complex question and the right experts collaborate to answer it.</div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
     # Contact form dialog
     @st.dialog("Contact Us")
@@ -440,7 +475,7 @@ def main():
         st.session_state.show_contact = False
 
     # CTA Section - compact
-    st.markdown('<h3 style="color: #fff; font-size: 1.2rem; text-align: center; margin: 10px 0 10px 0;">Ready to transform your workflow?</h3>', unsafe_allow_html=True)
+    show_html("cta header", '<h3 style="color: #fff; font-size: 1.2rem; text-align: center; margin: 10px 0 10px 0;">Ready to transform your workflow?</h3>')
 
     col1, col2, col3, col4 = st.columns([2, 1, 1, 2])
     with col2:
@@ -455,11 +490,16 @@ def main():
         st.session_state.show_contact = False
 
     # Footer - compact
-    st.markdown("""
+    show_html("footer", """
     <div style="text-align: center; padding: 8px; color: #666; border-top: 1px solid rgba(255,255,255,0.1); margin-top: 5px; font-size: 0.75rem;">
         <strong>X-Trillion</strong> | AI-Powered Financial Intelligence | © 2025
     </div>
-    """, unsafe_allow_html=True)
+    """)
+
+    # Remember element hashes so the next rerun can tell what changed
+    st.session_state.payload_hashes = payload_meter.hashes
+    if SHOW_PAYLOAD_REPORT:
+        render_payload_report(response_store)
 
 
 if __name__ == "__main__":
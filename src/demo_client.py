@@ -9,15 +9,26 @@ Calls MCPs directly:
 - IMF MCP for international data
 """
 
+import os
+import re
+import threading
+import time
 import requests
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from datetime import date, datetime, timezone
+from typing import Dict, Any, Callable, Optional, Tuple
 
-# MCP Endpoints
-FRED_MCP_URL = "https://fred-mcp.urbancanary.workers.dev"
-IMF_MCP_URL = "https://imf-mcp.urbancanary.workers.dev"
+from mcp_stream import STREAM_CHUNK_SIZE, decode_timeseries, iter_decoded, iter_mcp_text
+from query_normalizer import QueryNormalizer
+from wire_format import decode_series, decode_summary, encode_series, encode_summary
+
+# MCP Endpoints (overridable, e.g. to point load tests at src/stub_mcp.py)
+FRED_MCP_URL = os.environ.get("FRED_MCP_URL", "https://fred-mcp.urbancanary.workers.dev")
+IMF_MCP_URL = os.environ.get("IMF_MCP_URL", "https://imf-mcp.urbancanary.workers.dev")
 
 # Country name to ISO code mapping
 COUNTRY_CODES = {
@@ -86,48 +97,49 @@ def get_imf_data(country_code: str, tool_name: str = "imf_gdp") -> Tuple[Optiona
     return None, {}
 
 
-def get_fred_data(series_id: str, years: int = 10) -> Tuple[Optional[pd.DataFrame], Dict[str, str]]:
-    """Fetch data from FRED MCP."""
+def get_fred_data(series_id: str, years: int = 10,
+                  start_date: Optional[date] = None) -> Tuple[Optional[pd.DataFrame], Dict[str, str]]:
+    """Fetch data from FRED MCP.
+
+    The response body is decoded incrementally: the MCP envelope's embedded
+    text is unescaped as it streams in and ``chart_data`` is packed straight
+    into date/value arrays, so the payload is never held as a whole string.
+
+    Fetches from ``start_date`` if given, otherwise the last ``years``
+    years (aligned to the start of the month).
+    """
     try:
-        start_date = f"{datetime.now().year - years}-01-01"
+        if start_date is None:
+            start_date = months_ago(years * 12)
 
-        response = requests.post(
+        with requests.post(
             f"{FRED_MCP_URL}/mcp/tools/call",
             json={
                 "name": "fred_series_timeseries",
                 "arguments": {
                     "series_id": series_id,
-                    "start_date": start_date
+                    "start_date": start_date.isoformat()
                 }
             },
-            timeout=30
-        )
+            timeout=30,
+            stream=True
+        ) as response:
+            if response.status_code == 200:
+                # Raises MCPError if the envelope reports an error
+                text_chunks = iter_mcp_text(iter_decoded(response.iter_content(STREAM_CHUNK_SIZE)))
+                result, days, values = decode_timeseries(text_chunks)
 
-        if response.status_code == 200:
-            mcp_data = response.json()
-
-            # Check for error
-            if "error" in mcp_data:
-                print(f"FRED MCP error: {mcp_data['error']}")
-                return None, {}
-
-            # Extract content
-            if "content" in mcp_data and len(mcp_data["content"]) > 0:
-                import json
-                content_text = mcp_data["content"][0]["text"]
-                result = json.loads(content_text)
-
-                chart_data = result.get("chart_data", [])
                 series_info = {
                     "title": result.get("title", ""),
                     "units": result.get("units", ""),
                     "frequency": result.get("frequency", "")
                 }
 
-                if chart_data:
-                    df = pd.DataFrame(chart_data)
-                    df["date"] = pd.to_datetime(df["date"])
-                    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+                if days:
+                    df = pd.DataFrame({
+                        "date": pd.to_datetime(np.frombuffer(days, dtype=np.int64), unit="D"),
+                        "value": np.frombuffer(values, dtype=np.float64)
+                    })
                     df = df.dropna()
                     return df, series_info
 
@@ -172,21 +184,134 @@ def create_chart(df: pd.DataFrame, title: str, y_label: str = "Value") -> str:
 
 
 # Common queries and their FRED series
-# Format: keyword -> (series_id, title, y_label, transform)
+# Format: keyword -> (series_id, title, y_label, transform, lookback_years)
 # transform: "level" = raw data, "yoy" = year-over-year % change
+# lookback_years: default window when the query gives no date range,
+# sized to the series frequency (daily series get short windows)
 QUERY_MAPPINGS = {
-    "inflation": ("CPIAUCSL", "US Inflation Rate (YoY)", "Percent", "yoy"),
-    "us inflation": ("CPIAUCSL", "US Inflation Rate (YoY)", "Percent", "yoy"),
-    "cpi": ("CPIAUCSL", "US Consumer Price Index", "Index", "level"),
-    "unemployment": ("UNRATE", "US Unemployment Rate", "Percent", "level"),
-    "gdp": ("GDP", "US Gross Domestic Product", "Billions of Dollars", "level"),
-    "us gdp": ("GDP", "US Gross Domestic Product", "Billions of Dollars", "level"),
-    "fed funds": ("FEDFUNDS", "Federal Funds Rate", "Percent", "level"),
-    "interest rate": ("FEDFUNDS", "Federal Funds Rate", "Percent", "level"),
-    "10 year": ("DGS10", "10-Year Treasury Rate", "Percent", "level"),
-    "treasury": ("DGS10", "10-Year Treasury Rate", "Percent", "level"),
+    "inflation": ("CPIAUCSL", "US Inflation Rate (YoY)", "Percent", "yoy", 10),
+    "us inflation": ("CPIAUCSL", "US Inflation Rate (YoY)", "Percent", "yoy", 10),
+    "cpi": ("CPIAUCSL", "US Consumer Price Index", "Index", "level", 10),
+    "unemployment": ("UNRATE", "US Unemployment Rate", "Percent", "level", 10),
+    "gdp": ("GDP", "US Gross Domestic Product", "Billions of Dollars", "level", 20),
+    "us gdp": ("GDP", "US Gross Domestic Product", "Billions of Dollars", "level", 20),
+    "fed funds": ("FEDFUNDS", "Federal Funds Rate", "Percent", "level", 10),
+    "interest rate": ("FEDFUNDS", "Federal Funds Rate", "Percent", "level", 10),
+    "10 year": ("DGS10", "10-Year Treasury Rate", "Percent", "level", 2),
+    "treasury": ("DGS10", "10-Year Treasury Rate", "Percent", "level", 2),
 }
 
+# Phrases rewritten to the canonical wording routing understands
+QUERY_SYNONYMS = {
+    "jobless rate": "unemployment",
+    "jobless": "unemployment",
+    "joblessness": "unemployment",
+    "10 yr": "10 year",
+    "ten year": "10 year",
+    "bond yield": "treasury",
+    "bond yields": "treasury",
+    "federal funds": "fed funds",
+    "fed rate": "fed funds",
+    "interest rates": "interest rate",
+    "cost of living": "inflation",
+    "consumer price index": "cpi",
+    "gross domestic product": "gdp",
+    "economic growth": "gdp growth",
+    "united kingdom": "uk",
+    "great britain": "uk",
+}
+
+# Other words queries commonly use; kept as-is and used as typo targets
+_QUERY_WORDS = [
+    "price", "current account", "trade balance", "growth", "rate", "rates",
+    "yield", "yields", "since", "from", "after", "starting", "last", "past",
+    "previous", "year", "years", "month", "months", "decade", "show", "what",
+    "tell", "give", "about", "latest", "data", "chart", "trend", "history",
+    "over", "level", "today", "compare", "versus",
+]
+
+# Real words one edit from a keyword that the normalizer's typo rules
+# still allow (a dropped letter, or a long word); never corrected
+QUERY_PROTECTED_WORDS = [
+    "deflation", "disinflation", "reflation", "employment", "employed",
+    "currency", "currently", "producer", "levels", "indian", "chin",
+]
+
+# Vocabulary for typo correction; earlier words win ties
+QUERY_VOCABULARY = [
+    word
+    for phrase in [*QUERY_MAPPINGS, *QUERY_SYNONYMS.values(), *QUERY_SYNONYMS, *COUNTRY_CODES, *_QUERY_WORDS]
+    for word in phrase.split()
+]
+
+_normalizer = QueryNormalizer(QUERY_VOCABULARY, QUERY_SYNONYMS, QUERY_PROTECTED_WORDS)
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a query: typos fixed, synonyms expanded (memoized)."""
+    return _normalizer.normalize(query)
+
+
+# Date range phrases: "since 2008", "last 2 years", "past 18 months", "last decade"
+_SINCE_YEAR = re.compile(r"\b(?:since|from|after|starting in|starting)\s+((?:18|19|20)\d{2})\b")
+_LAST_N = re.compile(r"\b(?:last|past|previous)\s+(\d{1,3})\s*(years?|yrs?|months?|mos?)\b")
+_LAST_ONE = re.compile(r"\b(?:last|past|previous)\s+(year|month|decade)\b")
+
+
+def months_ago(months: int) -> date:
+    """Return the first day of the month ``months`` months before this one.
+
+    Windows are aligned to month starts so repeated queries within a month
+    request the same range.
+    """
+    today = date.today()
+    total = today.year * 12 + today.month - 1 - months
+    return date(total // 12, total % 12 + 1, 1)
+
+
+def describe_lookback(years: int) -> str:
+    """Describe a default lookback window for response text."""
+    return "over the past year" if years == 1 else f"over the past {years} years"
+
+
+def parse_date_range(query: str) -> Tuple[Optional[date], str, str]:
+    """Extract a date range from the query.
+
+    Returns:
+        (start_date, period_label, remaining_query) - start_date is None
+        when the query has no range. The matched phrase is removed from
+        remaining_query so it can't trigger keywords like "10 year".
+    """
+    query_lower = query.lower()
+
+    match = _SINCE_YEAR.search(query_lower)
+    if match:
+        year = int(match.group(1))
+        if year <= date.today().year:
+            remaining = query_lower[:match.start()] + query_lower[match.end():]
+            return date(year, 1, 1), f"since {year}", remaining
+
+    match = _LAST_N.search(query_lower)
+    if match:
+        count = int(match.group(1))
+        if count > 0:
+            if match.group(2).startswith("y"):
+                label = describe_lookback(count)
+                count *= 12
+            else:
+                label = "over the past month" if count == 1 else f"over the past {count} months"
+            remaining = query_lower[:match.start()] + query_lower[match.end():]
+            return months_ago(count), label, remaining
+
+    match = _LAST_ONE.search(query_lower)
+    if match:
+        unit = match.group(1)
+        months = {"month": 1, "year": 12, "decade": 120}[unit]
+        remaining = query_lower[:match.start()] + query_lower[match.end():]
+        return months_ago(months), f"over the past {unit}", remaining
+
+    return None, "", query_lower
+
 
 def transform_to_yoy(df: pd.DataFrame) -> pd.DataFrame:
     """Transform data to year-over-year percentage change."""
@@ -221,24 +346,220 @@ def detect_indicator(query: str) -> Tuple[str, str, str]:
         return ("imf_gdp", "Real GDP Growth", "Percent")
 
 
-def get_demo_response(query: str) -> Tuple[str, Optional[str], str]:
+# End-to-end budget for answering a query, and the part of it held back
+# for rendering the chart once data is in hand
+QUERY_DEADLINE_SECONDS = float(os.environ.get("DEMO_QUERY_DEADLINE", 1.5))
+CHART_RENDER_SECONDS = 0.3
+
+# Fallback tiers, best first; every response is annotated with the one served
+TIER_FRESH = "fresh"    # fetched within the budget
+TIER_CACHED = "cached"  # upstream too slow or failing, last fetched data served
+TIER_TEXT = "text"      # data arrived too late to render a chart
+TIER_CANNED = "canned"  # no data in time, canned suggestions
+
+# Upstream fetches run in this pool so a slow call can outlive the query's
+# deadline and still fill the cache for the next visitor
+FETCH_WORKERS = 8
+_fetch_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="mcp-fetch")
+
+# Fetches allowed to wait for a free worker. Past this, queries for keys
+# not already being fetched go straight to the fallback tiers rather than
+# queueing behind a slow upstream.
+FETCH_QUEUE_LIMIT = 8
+
+# Recently fetched data in wire format: key -> (payload, fetched_at)
+DATA_CACHE_SIZE = 256
+_data_cache: "OrderedDict[Tuple[str, ...], Tuple[bytes, datetime]]" = OrderedDict()
+_data_cache_lock = threading.Lock()
+
+# Fetches queued or running, one per cache key (guarded by _data_cache_lock)
+_in_flight: Dict[Tuple[str, ...], Future] = {}
+
+CANNED_SUGGESTIONS = """I can help you with US economic data from FRED! Try asking about:
+
+• **Inflation** - Consumer Price Index (CPI)
+• **Unemployment** - US unemployment rate
+• **GDP** - Gross Domestic Product
+• **Fed Funds Rate** - Federal Reserve interest rate
+• **Treasury Rates** - 10-year yields
+
+Just ask something like "Show me US inflation" or "What's the unemployment rate?"
+"""
+
+
+def _cache_put(key: Tuple[str, ...], payload: bytes) -> None:
+    """Store an encoded payload, evicting the least recently used entries."""
+    with _data_cache_lock:
+        _data_cache[key] = (payload, datetime.now(timezone.utc))
+        _data_cache.move_to_end(key)
+        while len(_data_cache) > DATA_CACHE_SIZE:
+            _data_cache.popitem(last=False)
+
+
+def _cache_get(key: Tuple[str, ...]) -> Optional[Tuple[bytes, datetime]]:
+    """Return (payload, fetched_at) for a key, or None."""
+    with _data_cache_lock:
+        entry = _data_cache.get(key)
+        if entry is not None:
+            _data_cache.move_to_end(key)
+        return entry
+
+
+def _submit_fetch(fetch: Callable[[], Any], cache_key: Tuple[str, ...]) -> Optional[Future]:
+    """Start a fetch for cache_key, or join the one already in flight.
+
+    Returns None when the pool's queue is full and nothing is in flight
+    for this key.
+    """
+    with _data_cache_lock:
+        future = _in_flight.get(cache_key)
+        if future is not None:
+            return future
+        if len(_in_flight) >= FETCH_WORKERS + FETCH_QUEUE_LIMIT:
+            return None
+        future = _fetch_pool.submit(fetch)
+        _in_flight[cache_key] = future
+
+    def forget(done: Future) -> None:
+        with _data_cache_lock:
+            if _in_flight.get(cache_key) is done:
+                del _in_flight[cache_key]
+
+    future.add_done_callback(forget)
+    return future
+
+
+def _cache_encoded(key: Tuple[str, ...], encode: Callable[[], bytes]) -> None:
+    """Encode and cache fetched data.
+
+    Failures are logged, never raised: a result the wire format can't hold
+    is still returned fresh, it just isn't cached.
+    """
+    try:
+        _cache_put(key, encode())
+    except Exception as e:
+        print(f"Cache write error for {key}: {e}")
+
+
+def _fetch_fred_cached(series_id: str, start_date: date) -> Optional[Tuple[pd.DataFrame, Dict[str, str]]]:
+    """Fetch a FRED series and cache it. Returns (df, series_info) or None."""
+    df, series_info = get_fred_data(series_id, start_date=start_date)
+    if df is None or len(df) == 0:
+        return None
+    _cache_encoded(("fred", series_id, start_date.isoformat()), lambda: encode_series(df, series_info))
+    return df, series_info
+
+
+def _fetch_imf_cached(country_code: str, tool_name: str) -> Optional[Dict]:
+    """Fetch an IMF summary and cache it. Returns the summary or None."""
+    imf_data, _ = get_imf_data(country_code, tool_name)
+    if imf_data is None:
+        return None
+    _cache_encoded(("imf", country_code, tool_name), lambda: encode_summary(imf_data))
+    return imf_data
+
+
+def fetch_with_deadline(fetch: Callable[[], Any], cache_key: Tuple[str, ...],
+                        decode: Callable[[bytes], Any],
+                        deadline_at: Optional[float]) -> Tuple[Any, str, Optional[datetime]]:
+    """Run an upstream fetch under the query deadline, falling back tier by tier.
+
+    ``deadline_at`` is a time.monotonic() timestamp, or None to wait for
+    the upstream call however long it takes.
+
+    Returns:
+        (data, tier, fetched_at) - fetched_at is set for cached data;
+        data is None for the canned tier.
+    """
+    def remaining(reserve: float = 0.0) -> Optional[float]:
+        if deadline_at is None:
+            return None
+        return max(0.0, deadline_at - reserve - time.monotonic())
+
+    # Concurrent queries for the same data share one upstream call
+    future = _submit_fetch(fetch, cache_key)
+
+    # 1. Fresh data, leaving time to render the chart
+    if future is not None:
+        try:
+            data = future.result(timeout=remaining(CHART_RENDER_SECONDS))
+            if data is not None:
+                return data, TIER_FRESH, None
+        except FuturesTimeout:
+            pass
+        except Exception as e:
+            print(f"Upstream fetch error: {e}")
+
+    # 2. Cached data; the fetch keeps running and refreshes the cache
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        payload, fetched_at = cached
+        return decode(payload), TIER_CACHED, fetched_at
+
+    # 3. Spend the rest of the budget waiting, answering without a chart
+    if future is not None and not future.done():
+        try:
+            data = future.result(timeout=remaining())
+            if data is not None:
+                return data, TIER_TEXT, None
+        except FuturesTimeout:
+            pass
+        except Exception as e:
+            print(f"Upstream fetch error: {e}")
+
+    # 4. Nothing in time
+    return None, TIER_CANNED, None
+
+
+def _tier_note(tier: str, fetched_at: Optional[datetime], chart_skipped: bool = False) -> str:
+    """Footnotes telling the visitor which fallback tier answered.
+
+    Cached data keeps its age note even when the chart is also skipped.
+    """
+    notes = []
+    if tier == TIER_CACHED:
+        notes.append(f"Showing data fetched {fetched_at:%d %B %Y, %H:%M} UTC while the live source catches up.")
+    if tier == TIER_TEXT or chart_skipped:
+        notes.append("Chart skipped to answer quickly - ask again for the full view.")
+    return "".join(f"\n\n*{note}*" for note in notes)
+
+
+def get_demo_response(query: str,
+                      deadline: Optional[float] = QUERY_DEADLINE_SECONDS) -> Tuple[str, Optional[str], str, str]:
     """
     Get a demo response for a query.
 
+    Upstream calls run under an end-to-end ``deadline`` in seconds (None
+    waits for them). As the budget runs out the answer falls back from
+    fresh data to cached data, then to text without a chart, then to the
+    canned suggestions.
+
     Returns:
-        (text_response, chart_html, agent_name)
+        (text_response, chart_html, agent_name, tier)
     """
-    query_lower = query.lower().strip()
+    deadline_at = None if deadline is None else time.monotonic() + deadline
+
+    # Canonicalize typos and wording ("inflaton", "jobless rate", "10yr yield")
+    query = normalize_query(query)
+
+    # Pull out any date range ("since 2008", "last 2 years") before routing
+    range_start, period_label, query_lower = parse_date_range(query)
+    query_lower = query_lower.strip()
 
     # Detect if query is about a specific country
-    country_info = detect_country(query)
+    country_info = detect_country(query_lower)
 
     # If non-US country detected, use IMF data
     if country_info and country_info[1] != "USA":
         country_name, country_code = country_info
-        tool_name, indicator_title, y_label = detect_indicator(query)
+        tool_name, indicator_title, y_label = detect_indicator(query_lower)
 
-        imf_data, series_info = get_imf_data(country_code, tool_name)
+        imf_data, tier, fetched_at = fetch_with_deadline(
+            lambda: _fetch_imf_cached(country_code, tool_name),
+            ("imf", country_code, tool_name),
+            decode_summary,
+            deadline_at
+        )
 
         if imf_data is not None:
             latest_value = imf_data.get("latest_value", 0)
@@ -265,6 +586,12 @@ Year-over-year change: **{change}%**
 
 *Source: IMF World Economic Outlook*"""
 
+            # Out of budget: answer without the chart (cached data stays marked as cached)
+            if tier == TIER_TEXT or (deadline_at is not None and time.monotonic() >= deadline_at):
+                if tier == TIER_FRESH:
+                    tier = TIER_TEXT
+                return text + _tier_note(tier, fetched_at, chart_skipped=True), None, "Isla", tier
+
             # Create a simple bar chart comparing years
             fig = go.Figure()
             fig.add_trace(go.Bar(
@@ -285,32 +612,50 @@ Year-over-year change: **{change}%**
             )
             chart_html = fig.to_html(include_plotlyjs="cdn", full_html=False)
 
-            return text, chart_html, "Isla"
+            return text + _tier_note(tier, fetched_at), chart_html, "Isla", tier
 
-        return f"I couldn't retrieve {indicator_title} data for {country_name}. Please try the full Minerva app.", None, "Isla"
+        return f"I couldn't retrieve {indicator_title} data for {country_name} right now. Please try the full Minerva app.\n\n{CANNED_SUGGESTIONS}", None, "Isla", TIER_CANNED
 
     # US data - use FRED
     series_id = None
     default_title = ""
     default_y_label = ""
     transform = "level"
+    lookback_years = 10
 
-    for keyword, (sid, ttl, ylabel, xform) in QUERY_MAPPINGS.items():
+    for keyword, (sid, ttl, ylabel, xform, lookback) in QUERY_MAPPINGS.items():
         if keyword in query_lower:
             series_id = sid
             default_title = ttl
             default_y_label = ylabel
             transform = xform
+            lookback_years = lookback
             break
 
     if series_id:
+        if range_start is None:
+            range_start = months_ago(lookback_years * 12)
+            period_label = describe_lookback(lookback_years)
+
+        # YoY needs an extra year of history before the window starts
+        fetch_start = range_start
+        if transform == "yoy":
+            fetch_start = date(range_start.year - 1, range_start.month, 1)
+
         # Fetch real data
-        df, series_info = get_fred_data(series_id)
+        fetched, tier, fetched_at = fetch_with_deadline(
+            lambda: _fetch_fred_cached(series_id, fetch_start),
+            ("fred", series_id, fetch_start.isoformat()),
+            decode_series,
+            deadline_at
+        )
+        df, series_info = fetched if fetched is not None else (None, {})
 
         if df is not None and len(df) > 0:
             # Apply transformation if needed
             if transform == "yoy":
                 df = transform_to_yoy(df)
+                df = df[df["date"] >= pd.Timestamp(range_start)]
                 title = default_title  # Use our title for YoY
                 y_label = default_y_label
             else:
@@ -322,6 +667,11 @@ Year-over-year change: **{change}%**
                 latest_date = latest["date"].strftime("%B %Y")
                 latest_value = latest["value"]
 
+                # Out of budget: answer without the chart (cached data stays marked as cached)
+                chart_skipped = tier == TIER_TEXT or (deadline_at is not None and time.monotonic() >= deadline_at)
+                if chart_skipped and tier == TIER_FRESH:
+                    tier = TIER_TEXT
+
                 # Format the response based on transform type
                 if transform == "yoy":
                     direction = "up" if latest_value > 0 else "down"
@@ -329,37 +679,30 @@ Year-over-year change: **{change}%**
 
 **Current Inflation ({latest_date}):** {latest_value:.1f}%
 
-US inflation is currently running at **{abs(latest_value):.1f}%** year-over-year, based on the Consumer Price Index.
-
-The chart below shows the inflation trend over the past 10 years."""
+US inflation is currently running at **{abs(latest_value):.1f}%** year-over-year, based on the Consumer Price Index."""
+                    chart_note = f"The chart below shows the inflation trend {period_label}."
                 else:
                     text = f"""Here's the latest **{title}** data from FRED:
 
-**Latest Reading ({latest_date}):** {latest_value:,.2f} {y_label}
+**Latest Reading ({latest_date}):** {latest_value:,.2f} {y_label}"""
+                    chart_note = f"The chart below shows the historical trend {period_label}."
 
-The chart below shows the historical trend over the past 10 years."""
+                if chart_skipped:
+                    return text + _tier_note(tier, fetched_at, chart_skipped=True), None, "Fred", tier
 
                 chart_html = create_chart(df, title, y_label)
-                return text, chart_html, "Fred"
+                return f"{text}\n\n{chart_note}{_tier_note(tier, fetched_at)}", chart_html, "Fred", tier
 
-        return f"I tried to fetch {default_title} data but couldn't retrieve it. Please try again.", None, "Fred"
+        return f"I tried to fetch {default_title} data but couldn't retrieve it in time. Please try again.\n\n{CANNED_SUGGESTIONS}", None, "Fred", TIER_CANNED
 
     # Default response for unmatched queries
-    return """I can help you with US economic data from FRED! Try asking about:
-
-• **Inflation** - Consumer Price Index (CPI)
-• **Unemployment** - US unemployment rate
-• **GDP** - Gross Domestic Product
-• **Fed Funds Rate** - Federal Reserve interest rate
-• **Treasury Rates** - 10-year yields
-
-Just ask something like "Show me US inflation" or "What's the unemployment rate?"
-""", None, "Grace"
+    return CANNED_SUGGESTIONS, None, "Grace", TIER_CANNED
 
 
 if __name__ == "__main__":
     # Test
-    text, chart, agent = get_demo_response("show me us inflation")
+    text, chart, agent, tier = get_demo_response("show me us inflation")
     print(f"Agent: {agent}")
+    print(f"Tier: {tier}")
     print(f"Text: {text[:200]}...")
     print(f"Chart: {'Yes' if chart else 'No'}")
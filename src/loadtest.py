@@ -0,0 +1,307 @@
+"""
+Load Test Harness
+=================
+Headless load generator for the Streamlit app (app.py).
+
+Simulates N concurrent browser sessions over Streamlit's websocket
+protocol (/_stcore/stream). Each session loads the page, then submits
+prompts through the chat input and waits for the answer to render. The
+app is pointed at a local stub MCP (src/stub_mcp.py), so the results
+measure the app itself rather than the upstream workers.
+
+For each concurrency level it reports:
+- page load and prompt-to-answer latency percentiles
+- server CPU and RSS, sampled from the Streamlit process
+- bytes received per session
+
+It then reports the level at which latency saturates.
+
+Requires the optional packages websockets and psutil:
+    pip install websockets psutil
+    python src/loadtest.py --levels 1,2,4,8,16,32 --prompts 3
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from stub_mcp import start_stub_server
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+DEFAULT_PROMPTS = [
+    "Show me US inflation",
+    "What's the unemployment rate?",
+    "10 year treasury over the last 2 years",
+    "Brazil GDP growth",
+    "GDP since 1990",
+]
+
+# A level is saturated when its p90 prompt latency is this many times the
+# first level's, or when any session fails
+SATURATION_FACTOR = 3.0
+
+# Per-run timeout for a single page load or prompt
+RUN_TIMEOUT = 60.0
+
+
+class SessionResult:
+    """Measurements from one simulated browser session."""
+
+    def __init__(self):
+        self.page_load = None
+        self.prompt_latencies: List[float] = []
+        self.bytes_received = 0
+        self.error: Optional[str] = None
+
+
+class ResourceSampler:
+    """Samples CPU and RSS of a process in a background thread."""
+
+    def __init__(self, pid: Optional[int], interval: float = 0.5):
+        self.interval = interval
+        self.cpu: List[float] = []
+        self.rss: List[int] = []
+        self._process = psutil.Process(pid) if psutil and pid else None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        if self._process:
+            self._process.cpu_percent()  # Prime the counter
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.cpu.append(self._process.cpu_percent())
+            self.rss.append(self._process.memory_info().rss)
+
+
+def _rerun_message(widget_id: Optional[str] = None, prompt: Optional[str] = None) -> bytes:
+    """Build the BackMsg a browser sends to (re)run the script."""
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    msg.rerun_script.page_script_hash = ""
+    if widget_id and prompt:
+        state = msg.rerun_script.widget_states.widgets.add()
+        state.id = widget_id
+        # chat_input moved from string_trigger_value to chat_input_value
+        if "chat_input_value" in WidgetState.DESCRIPTOR.fields_by_name:
+            state.chat_input_value.data = prompt
+        else:
+            state.string_trigger_value.data = prompt
+    return msg.SerializeToString()
+
+
+async def _wait_for_run(ws, result: SessionResult) -> Optional[str]:
+    """Consume messages until the script run finishes.
+
+    Runs ended early by st.rerun() are followed through to the final
+    run. Returns the chat input widget id if one was rendered.
+    """
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    widget_id = None
+    while True:
+        data = await ws.recv()
+        result.bytes_received += len(data)
+        msg = ForwardMsg()
+        msg.ParseFromString(data)
+
+        if msg.HasField("delta") and msg.delta.HasField("new_element"):
+            element = msg.delta.new_element
+            if element.WhichOneof("type") == "chat_input":
+                widget_id = element.chat_input.id
+
+        if msg.HasField("script_finished"):
+            status = msg.script_finished
+            if status == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                raise RuntimeError("App failed to compile")
+            if status != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return widget_id
+
+
+async def run_session(url: str, prompts: List[str]) -> SessionResult:
+    """Simulate one visitor: load the page, then submit each prompt."""
+    result = SessionResult()
+    try:
+        async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+            start = time.perf_counter()
+            await ws.send(_rerun_message())
+            widget_id = await asyncio.wait_for(_wait_for_run(ws, result), RUN_TIMEOUT)
+            result.page_load = time.perf_counter() - start
+
+            if widget_id is None:
+                raise RuntimeError("No chat input rendered")
+
+            for prompt in prompts:
+                start = time.perf_counter()
+                await ws.send(_rerun_message(widget_id, prompt))
+                await asyncio.wait_for(_wait_for_run(ws, result), RUN_TIMEOUT)
+                result.prompt_latencies.append(time.perf_counter() - start)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+async def run_level(url: str, sessions: int, prompts: List[str]) -> List[SessionResult]:
+    """Run ``sessions`` visitors concurrently."""
+    return await asyncio.gather(*(run_session(url, prompts) for _ in range(sessions)))
+
+
+def summarize(sessions: int, results: List[SessionResult], sampler: ResourceSampler,
+              elapsed: float) -> Dict[str, float]:
+    """Aggregate one level's session results and resource samples."""
+    loads = [r.page_load for r in results if r.page_load is not None]
+    prompts = [latency for r in results for latency in r.prompt_latencies]
+    return {
+        "sessions": sessions,
+        "errors": sum(1 for r in results if r.error),
+        "load_p50": percentile(loads, 50),
+        "load_p90": percentile(loads, 90),
+        "prompt_p50": percentile(prompts, 50),
+        "prompt_p90": percentile(prompts, 90),
+        "prompt_p99": percentile(prompts, 99),
+        "throughput": len(prompts) / elapsed if elapsed else 0.0,
+        "bytes_per_session": sum(r.bytes_received for r in results) / len(results),
+        "cpu_mean": sum(sampler.cpu) / len(sampler.cpu) if sampler.cpu else float("nan"),
+        "cpu_max": max(sampler.cpu, default=float("nan")),
+        "rss_max_mb": max(sampler.rss, default=0) / 1024 / 1024 or float("nan"),
+    }
+
+
+def print_report(rows: List[Dict[str, float]]) -> None:
+    """Print the per-level table and the saturation point."""
+    print(f"\n{'sessions':>8} {'errors':>6} {'load p50':>9} {'load p90':>9} "
+          f"{'ask p50':>8} {'ask p90':>8} {'ask p99':>8} {'asks/s':>7} "
+          f"{'KB/sess':>8} {'cpu avg':>8} {'cpu max':>8} {'rss MB':>7}")
+    for row in rows:
+        print(f"{row['sessions']:>8} {row['errors']:>6} {row['load_p50']:>8.2f}s {row['load_p90']:>8.2f}s "
+              f"{row['prompt_p50']:>7.2f}s {row['prompt_p90']:>7.2f}s {row['prompt_p99']:>7.2f}s "
+              f"{row['throughput']:>7.1f} {row['bytes_per_session'] / 1024:>8.0f} "
+              f"{row['cpu_mean']:>7.0f}% {row['cpu_max']:>7.0f}% {row['rss_max_mb']:>7.0f}")
+
+    baseline = rows[0]["prompt_p90"] if rows else 0.0
+    for previous, row in zip([None] + rows, rows):
+        if row["errors"] or (baseline and row["prompt_p90"] > SATURATION_FACTOR * baseline):
+            if previous is None:
+                print(f"\nSaturated already at {row['sessions']} session(s)")
+            else:
+                print(f"\nCapacity saturates between {previous['sessions']} and {row['sessions']} "
+                      f"concurrent sessions (p90 {row['prompt_p90']:.2f}s vs {baseline:.2f}s baseline, "
+                      f"{row['errors']} errors)")
+            return
+    if rows:
+        print(f"\nNo saturation up to {rows[-1]['sessions']} concurrent sessions")
+
+
+def launch_app(port: int, mcp_url: str) -> subprocess.Popen:
+    """Start app.py under Streamlit, pointed at the stub MCP, and wait for health."""
+    env = dict(os.environ, FRED_MCP_URL=mcp_url, IMF_MCP_URL=mcp_url)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+         "--server.port", str(port), "--server.headless", "true",
+         "--browser.gatherUsageStats", "false"],
+        cwd=APP_PATH.parent, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Streamlit exited during startup")
+        try:
+            if requests.get(f"http://127.0.0.1:{port}/_stcore/health", timeout=1).ok:
+                return process
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError("Streamlit did not become healthy within 60s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--levels", default="1,2,4,8,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--prompts", type=int, default=3, help="Prompts submitted per session")
+    parser.add_argument("--port", type=int, default=8599, help="Port for the launched app")
+    parser.add_argument("--url", help="Websocket URL of an already running app (skips launch)")
+    parser.add_argument("--pid", type=int, help="Server PID to sample when using --url")
+    parser.add_argument("--mcp-latency", type=float, default=0.0, help="Stub MCP delay in seconds")
+    args = parser.parse_args()
+
+    if websockets is None:
+        sys.exit("The load test needs the websockets package: pip install websockets")
+    if psutil is None:
+        print("psutil not installed - server CPU/RSS will not be reported")
+
+    levels = [int(level) for level in args.levels.split(",")]
+    prompts = [DEFAULT_PROMPTS[i % len(DEFAULT_PROMPTS)] for i in range(args.prompts)]
+
+    process = None
+    if args.url:
+        url, pid = args.url, args.pid
+    else:
+        stub = start_stub_server(latency=args.mcp_latency)
+        mcp_url = f"http://127.0.0.1:{stub.server_port}"
+        print(f"Stub MCP at {mcp_url}, launching app on port {args.port}...")
+        process = launch_app(args.port, mcp_url)
+        url, pid = f"ws://127.0.0.1:{args.port}/_stcore/stream", process.pid
+
+    rows = []
+    try:
+        for sessions in levels:
+            print(f"Running {sessions} concurrent session(s)...")
+            with ResourceSampler(pid) as sampler:
+                start = time.perf_counter()
+                results = asyncio.run(run_level(url, sessions, prompts))
+                elapsed = time.perf_counter() - start
+            for error in {r.error for r in results if r.error}:
+                print(f"  session error: {error}")
+            rows.append(summarize(sessions, results, sampler, elapsed))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
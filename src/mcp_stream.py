@@ -0,0 +1,362 @@
+"""
+Streaming MCP Decoder
+=====================
+Incremental decoding of MCP tool responses.
+
+MCP servers return the tool result as a JSON document serialized into
+the ``content[0]["text"]`` string of the envelope. Decoding that with
+``response.json()`` followed by ``json.loads`` parses the payload twice
+and keeps the escaped text, the unescaped text and the decoded objects
+alive at the same time.
+
+This module walks the HTTP body chunk by chunk instead:
+- the envelope scanner unescapes the embedded text as it arrives
+- the result scanner consumes those pieces directly and packs
+  ``chart_data`` into typed date/value arrays
+"""
+
+import codecs
+import json
+import re
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+# Bytes requested from the socket per read
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# chart_data dates are stored as days since 1970-01-01
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SIMPLE_STRING = re.compile(r'"([^"\\]*)"')
+# Longest run of complete string content; stops at the closing quote or
+# before an escape that is cut off by the end of the buffer. Surrogate
+# pairs are kept together so each segment decodes on its own; a lone high
+# surrogate is taken once the input after it shows no low surrogate follows.
+_STRING_SEGMENT = re.compile(
+    r'(?:[^"\\]+'
+    r'|\\["\\/bfnrt]'
+    r'|\\u[dD][89abAB][0-9a-fA-F]{2}\\u[dD][c-fC-F][0-9a-fA-F]{2}'
+    r'|\\u[dD][89abAB][0-9a-fA-F]{2}(?=[^\\]|\\[^u]|\\u[^dD]|\\u[dD][^c-fC-F])'
+    r'|\\u(?![dD][89abAB])[0-9a-fA-F]{4})*'
+)
+# The common {"date": ..., "value": ...} point shape, matched in one go
+_POINT = re.compile(
+    r'\{\s*"date"\s*:\s*"([^"\\]*)"\s*,\s*"value"\s*:\s*'
+    r'(?:"([^"\\]*)"|(-?[0-9][-+.0-9eE]*)|null)\s*\}'
+)
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_SCALAR_CHARS = re.compile(r"[-+.0-9a-zA-Z]*")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class MCPError(Exception):
+    """Raised when an MCP envelope carries an ``error`` field."""
+
+
+class _Scanner:
+    """Pull-style JSON scanner over an iterator of text chunks.
+
+    Only the unconsumed tail of the current chunk is buffered, so memory
+    stays bounded by the chunk size rather than the document size.
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buf = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer. Returns False at EOF."""
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = self._buf[self._pos:] + chunk
+                self._pos = 0
+                return True
+        return False
+
+    def _ensure(self, n: int) -> None:
+        """Make sure at least ``n`` unconsumed characters are buffered."""
+        while len(self._buf) - self._pos < n:
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at EOF)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def accept(self, ch: str) -> bool:
+        """Consume ``ch`` if it is the next token."""
+        if self.peek() == ch:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, ch: str) -> None:
+        """Consume ``ch`` or raise ValueError."""
+        if not self.accept(ch):
+            found = self.peek() or "end of input"
+            raise ValueError(f"Expected {ch!r} in JSON, found {found!r}")
+
+    def match(self, pattern: "re.Pattern[str]") -> Optional["re.Match[str]"]:
+        """Match ``pattern`` at the next token, consuming it on success.
+
+        Only the buffered input is searched, so callers need a fallback
+        for tokens that straddle a chunk boundary.
+        """
+        self.peek()
+        match = pattern.match(self._buf, self._pos)
+        if match:
+            self._pos = match.end()
+        return match
+
+    def iter_string(self) -> Iterator[str]:
+        """Yield decoded pieces of the next JSON string without joining them."""
+        self.expect('"')
+        while True:
+            segment = _STRING_SEGMENT.match(self._buf, self._pos)
+            self._pos = segment.end()
+            if segment.end() > segment.start():
+                text = segment.group()
+                # Unescape with the C decoder; plain runs need no decoding
+                yield json.loads(f'"{text}"') if "\\" in text else text
+
+            if self._pos < len(self._buf) and self._buf[self._pos] == '"':
+                self._pos += 1
+                return
+
+            # Buffer ends mid-string or mid-escape: pull in more input
+            stalled = len(self._buf) - self._pos
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+            # The longest valid cut-off escape is a partial surrogate pair
+            # (11 chars), so a longer stall can only be a malformed escape
+            if stalled >= 12:
+                raise ValueError("Invalid escape in JSON string")
+
+    def read_string(self) -> str:
+        """Decode the next JSON string."""
+        if self.peek() == '"':
+            # Fast path for strings without escapes that are fully buffered
+            simple = _SIMPLE_STRING.match(self._buf, self._pos)
+            if simple:
+                self._pos = simple.end()
+                return simple.group(1)
+        return "".join(self.iter_string())
+
+    def _read_scalar(self) -> Any:
+        """Decode a number or literal at the current position."""
+        # Make sure the whole token is buffered before matching it
+        while _SCALAR_CHARS.match(self._buf, self._pos).end() == len(self._buf):
+            if not self._fill():
+                break
+
+        match = _NUMBER.match(self._buf, self._pos)
+        if match:
+            self._pos = match.end()
+            text = match.group()
+            if "." in text or "e" in text or "E" in text:
+                return float(text)
+            return int(text)
+
+        for literal, value in _LITERALS.items():
+            if self._buf.startswith(literal, self._pos):
+                self._pos += len(literal)
+                return value
+
+        found = self.peek() or "end of input"
+        raise ValueError(f"Unexpected {found!r} in JSON")
+
+    def read_value(self) -> Any:
+        """Decode the next JSON value in full. Use for small values only."""
+        ch = self.peek()
+        if ch == '"':
+            return self.read_string()
+        if ch == "{":
+            self._pos += 1
+            obj = {}
+            if self.accept("}"):
+                return obj
+            while True:
+                key = self.read_string()
+                self.expect(":")
+                obj[key] = self.read_value()
+                if not self.accept(","):
+                    self.expect("}")
+                    return obj
+        if ch == "[":
+            self._pos += 1
+            items = []
+            if self.accept("]"):
+                return items
+            while True:
+                items.append(self.read_value())
+                if not self.accept(","):
+                    self.expect("]")
+                    return items
+        return self._read_scalar()
+
+    def skip_value(self) -> None:
+        """Consume the next JSON value without building it."""
+        ch = self.peek()
+        if ch == '"':
+            for _ in self.iter_string():
+                pass
+        elif ch in ("{", "["):
+            close = "}" if ch == "{" else "]"
+            self._pos += 1
+            if self.accept(close):
+                return
+            while True:
+                if ch == "{":
+                    self.skip_value()
+                    self.expect(":")
+                self.skip_value()
+                if not self.accept(","):
+                    self.expect(close)
+                    return
+        else:
+            self._read_scalar()
+
+
+def iter_decoded(byte_chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[str]:
+    """Decode a stream of byte chunks, handling characters split across chunks."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in byte_chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_mcp_text(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield the unescaped ``content[0]["text"]`` of an MCP envelope in pieces.
+
+    Raises MCPError if the envelope reports an error before its content.
+    """
+    scanner = _Scanner(chunks)
+    scanner.expect("{")
+    if scanner.accept("}"):
+        return
+
+    while True:
+        key = scanner.read_string()
+        scanner.expect(":")
+
+        if key == "error":
+            raise MCPError(scanner.read_value())
+
+        if key == "content":
+            scanner.expect("[")
+            if not scanner.accept("{"):
+                return
+            while True:
+                field = scanner.read_string()
+                scanner.expect(":")
+                if field == "text":
+                    yield from scanner.iter_string()
+                    return
+                scanner.skip_value()
+                if not scanner.accept(","):
+                    return
+
+        scanner.skip_value()
+        if not scanner.accept(","):
+            return
+
+
+def _to_float(value: Any) -> float:
+    """Coerce a chart_data value to float, NaN when missing (FRED uses '.')."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return float("nan")
+
+
+def _decode_points(scanner: _Scanner, days: array, values: array) -> None:
+    """Decode a chart_data array of {"date", "value"} objects into packed arrays."""
+    scanner.expect("[")
+    if scanner.accept("]"):
+        return
+
+    while True:
+        point_date = None
+        point_value = float("nan")
+
+        point = scanner.match(_POINT)
+        if point:
+            point_date = point.group(1)
+            raw_value = point.group(2) if point.group(2) is not None else point.group(3)
+            if raw_value is not None:
+                point_value = _to_float(raw_value)
+        else:
+            scanner.expect("{")
+            if not scanner.accept("}"):
+                while True:
+                    key = scanner.read_string()
+                    scanner.expect(":")
+                    if key == "date":
+                        point_date = scanner.read_value()
+                    elif key == "value":
+                        point_value = _to_float(scanner.read_value())
+                    else:
+                        scanner.skip_value()
+                    if not scanner.accept(","):
+                        scanner.expect("}")
+                        break
+
+        if isinstance(point_date, str):
+            try:
+                day = date.fromisoformat(point_date[:10]).toordinal() - _EPOCH_ORDINAL
+            except ValueError:
+                day = None
+            if day is not None:
+                days.append(day)
+                values.append(point_value)
+
+        if not scanner.accept(","):
+            scanner.expect("]")
+            return
+
+
+def decode_timeseries(chunks: Iterable[str]) -> Tuple[Dict[str, Any], array, array]:
+    """Decode a FRED timeseries result document.
+
+    Returns:
+        (metadata, days, values) where ``days`` is an int64 array of days
+        since 1970-01-01 and ``values`` is the matching float64 array.
+        Only scalar top-level fields are kept in ``metadata``.
+    """
+    scanner = _Scanner(chunks)
+    metadata: Dict[str, Any] = {}
+    days = array("q")
+    values = array("d")
+
+    scanner.expect("{")
+    if scanner.accept("}"):
+        return metadata, days, values
+
+    while True:
+        key = scanner.read_string()
+        scanner.expect(":")
+        if key == "chart_data":
+            _decode_points(scanner, days, values)
+        elif scanner.peek() in ("{", "["):
+            scanner.skip_value()
+        else:
+            metadata[key] = scanner.read_value()
+        if not scanner.accept(","):
+            scanner.expect("}")
+            return metadata, days, values
@@ -0,0 +1,188 @@
+"""
+Payload Budget
+==============
+Memory and payload accounting for the Streamlit demo.
+
+- ResponseStore keeps demo responses server-side, keyed by session, with
+  a per-session byte cap, idle eviction and a server-wide ceiling that
+  drops stored charts (least recently used first) before whole responses
+- PayloadMeter tallies the bytes each rerun hands to the browser, per
+  element, so the elements that dominate the delta are visible
+
+Limits can be tuned with environment variables:
+- DEMO_SESSION_RESPONSE_LIMIT - max bytes stored per session
+- DEMO_SESSION_IDLE_SECONDS - idle time before a stored response is evicted
+- DEMO_SERVER_MEMORY_CEILING - max bytes stored across all sessions
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# (text, chart_html, agent_name, query)
+DemoResponse = Tuple[str, Optional[str], str, str]
+
+SESSION_RESPONSE_LIMIT = int(os.environ.get("DEMO_SESSION_RESPONSE_LIMIT", 512 * 1024))
+SESSION_IDLE_SECONDS = int(os.environ.get("DEMO_SESSION_IDLE_SECONDS", 15 * 60))
+SERVER_MEMORY_CEILING = int(os.environ.get("DEMO_SERVER_MEMORY_CEILING", 64 * 1024 * 1024))
+
+
+def response_size(response: DemoResponse) -> int:
+    """Approximate stored size of a response in bytes (UTF-8 encoded text)."""
+    return sum(len(part.encode("utf-8")) for part in response if part)
+
+
+class ResponseStore:
+    """Server-wide store of demo responses, one per session.
+
+    Entries are kept in least-recently-used order. When the total stored
+    size goes over the ceiling, charts are dropped first since the text
+    answer is still useful on its own; whole entries are evicted only if
+    that isn't enough.
+    """
+
+    def __init__(self, session_limit: int = SESSION_RESPONSE_LIMIT,
+                 idle_seconds: int = SESSION_IDLE_SECONDS,
+                 ceiling: int = SERVER_MEMORY_CEILING):
+        self.session_limit = session_limit
+        self.idle_seconds = idle_seconds
+        self.ceiling = ceiling
+        self._lock = threading.Lock()
+        # session_id -> [response, size, last_used]
+        self._entries: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._total = 0
+        self.charts_dropped = 0
+        self.evictions = 0
+
+    def put(self, session_id: str, response: DemoResponse) -> DemoResponse:
+        """Store a session's response. Returns what was actually kept.
+
+        A chart that would push the response over the per-session limit
+        is not stored; the text answer always is.
+        """
+        text, chart_html, agent_name, query = response
+        now = time.monotonic()
+        with self._lock:
+            if chart_html and response_size(response) > self.session_limit:
+                response = (text, None, agent_name, query)
+                self.charts_dropped += 1
+
+            self._remove(session_id)
+            size = response_size(response)
+            self._entries[session_id] = [response, size, now]
+            self._total += size
+            self._evict_idle(now)
+            self._enforce_ceiling()
+            entry = self._entries.get(session_id)
+            return entry[0] if entry else (text, None, agent_name, query)
+
+    def get(self, session_id: str) -> Optional[DemoResponse]:
+        """Return a session's stored response, or None if absent or evicted."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            entry[2] = now
+            self._entries.move_to_end(session_id)
+            return entry[0]
+
+    def discard(self, session_id: str) -> None:
+        """Forget a session's response."""
+        with self._lock:
+            self._remove(session_id)
+
+    def stats(self) -> Dict[str, int]:
+        """Current usage counters for reporting."""
+        with self._lock:
+            return {
+                "sessions": len(self._entries),
+                "stored_bytes": self._total,
+                "ceiling_bytes": self.ceiling,
+                "charts_dropped": self.charts_dropped,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, session_id: str) -> None:
+        entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            self._total -= entry[1]
+
+    def _evict_idle(self, now: float) -> None:
+        """Evict entries idle longer than idle_seconds (oldest first)."""
+        while self._entries:
+            session_id, entry = next(iter(self._entries.items()))
+            if now - entry[2] < self.idle_seconds:
+                break
+            self._remove(session_id)
+            self.evictions += 1
+
+    def _enforce_ceiling(self) -> None:
+        """Degrade stored responses until the total fits under the ceiling."""
+        if self._total <= self.ceiling:
+            return
+
+        # Drop charts from the least recently used sessions first
+        for entry in self._entries.values():
+            if self._total <= self.ceiling:
+                return
+            text, chart_html, agent_name, query = entry[0]
+            if chart_html:
+                entry[0] = (text, None, agent_name, query)
+                new_size = response_size(entry[0])
+                self._total -= entry[1] - new_size
+                entry[1] = new_size
+                self.charts_dropped += 1
+
+        # Still over: evict whole responses, oldest first
+        while self._total > self.ceiling and self._entries:
+            session_id = next(iter(self._entries))
+            self._remove(session_id)
+            self.evictions += 1
+
+
+class PayloadMeter:
+    """Per-rerun accounting of the bytes each element sends to the browser.
+
+    Streamlit resends every element on a rerun, but the frontend caches
+    large messages it has already seen, so what matters most is the bytes
+    of elements whose content changed. Pass the previous rerun's
+    ``hashes`` in to mark changed elements.
+    """
+
+    def __init__(self, previous_hashes: Optional[Dict[str, int]] = None):
+        self._previous = previous_hashes or {}
+        self.hashes: Dict[str, int] = {}
+        self.elements: List[Tuple[str, int, bool]] = []
+
+    def record(self, label: str, payload: str) -> str:
+        """Record an element's payload and return it unchanged."""
+        digest = hash(payload)
+        changed = self._previous.get(label) != digest
+        self.hashes[label] = digest
+        self.elements.append((label, len(payload.encode("utf-8")), changed))
+        return payload
+
+    def total_bytes(self) -> int:
+        """Bytes sent by all recorded elements this rerun."""
+        return sum(size for _, size, _ in self.elements)
+
+    def delta_bytes(self) -> int:
+        """Bytes sent by elements that changed since the previous rerun."""
+        return sum(size for _, size, changed in self.elements if changed)
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Rows for display, largest elements first."""
+        total = self.total_bytes() or 1
+        rows = []
+        for label, size, changed in sorted(self.elements, key=lambda e: e[1], reverse=True):
+            rows.append({
+                "element": label,
+                "bytes": size,
+                "share": f"{size / total:.1%}",
+                "changed": changed,
+            })
+        return rows
@@ -0,0 +1,154 @@
+"""
+Query Normalizer
+================
+Turns free-form demo queries into canonical forms before routing.
+
+Routing in demo_client matches exact substrings, so "inflaton",
+"jobless rate" or "10yr yield" would miss. Normalization:
+- tokenizes the query (splitting "10yr" into "10 yr")
+- corrects typos against the known vocabulary using a symmetric-delete
+  index, so a lookup costs a handful of dict probes however large the
+  vocabulary grows
+- leaves real words alone: protected words are never corrected, a
+  two-edit correction must keep the first letter ("deflation" is not a
+  typo of "inflation"), and short words only accept a swapped pair or a
+  dropped letter ("rice" is not a typo of "price", nor "chili" of "chile")
+- expands synonyms to canonical phrases ("jobless" -> "unemployment")
+- memoizes normalized queries in a bounded LRU cache
+
+Equivalent queries normalize to the same string, which also makes it a
+better cache key downstream.
+"""
+
+import re
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Set
+
+_TOKEN = re.compile(r"\d+(?:\.\d+)?|[a-z]+(?:'[a-z]+)?")
+
+# Tokens shorter than this are never corrected ("us", "me", "uk" ...)
+MIN_CORRECTION_LENGTH = 4
+
+# Tokens shorter than this are mostly real words one edit from a keyword,
+# so they get the narrower typo rules in _within_budget
+SHORT_WORD_LENGTH = 6
+
+
+def max_edit_distance(word: str) -> int:
+    """Typo budget for a word: longer words tolerate more edits."""
+    return 2 if len(word) >= 8 else 1
+
+
+def _within_budget(token: str, candidate: str, distance: int) -> bool:
+    """Whether a correction is plausible as a typo.
+
+    Beyond one edit the first letter must match: "inflaton" -> "inflation"
+    is a typo, "deflation" -> "inflation" is a different word. Short words
+    must also keep the first letter, and only a swapped pair ("fnuds") or a
+    dropped letter ("chna") counts; substitutions and extra letters turn
+    too many real words into keywords ("field" -> "yield", "coast" -> "cost").
+    """
+    if distance > 1 or len(token) < SHORT_WORD_LENGTH:
+        if token[0] != candidate[0]:
+            return False
+    if len(token) < SHORT_WORD_LENGTH:
+        dropped_letter = len(candidate) == len(token) + 1
+        swapped_pair = len(candidate) == len(token) and sorted(candidate) == sorted(token)
+        return dropped_letter or swapped_pair
+    return True
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """All strings obtained by deleting up to ``distance`` characters."""
+    variants = {word}
+    for n in range(1, min(distance, len(word) - 1) + 1):
+        for positions in combinations(range(len(word)), n):
+            variants.add("".join(c for i, c in enumerate(word) if i not in positions))
+    return variants
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein (optimal string alignment) distance, capped at limit + 1."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class QueryNormalizer:
+    """Typo-tolerant, synonym-expanding query normalizer.
+
+    Args:
+        vocabulary: words routing understands (never corrected, and the
+            targets for correction). Earlier words win ties.
+        synonyms: phrase -> canonical phrase, applied after correction.
+            Phrases are matched on word boundaries, longest first.
+        protected: real words near the vocabulary that must never be
+            corrected ("deflation", "employment", "pain").
+        cache_size: number of normalized queries to memoize.
+    """
+
+    def __init__(self, vocabulary: Iterable[str], synonyms: Optional[Dict[str, str]] = None,
+                 protected: Iterable[str] = (), cache_size: int = 4096):
+        self._protected: Set[str] = set(protected)
+        self._rank: Dict[str, int] = {}
+        self._index: Dict[str, List[str]] = {}
+        for word in vocabulary:
+            self.add_word(word)
+
+        self._synonyms = dict(synonyms or {})
+        phrases = sorted(self._synonyms, key=len, reverse=True)
+        self._synonym_pattern = (
+            re.compile(r"\b(" + "|".join(re.escape(p) for p in phrases) + r")\b")
+            if phrases else None
+        )
+
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    def add_word(self, word: str) -> None:
+        """Add a word to the vocabulary and its deletes to the index."""
+        if word in self._rank or not word.isalpha():
+            return
+        self._rank[word] = len(self._rank)
+        if len(word) >= MIN_CORRECTION_LENGTH:
+            for variant in _deletes(word, max_edit_distance(word)):
+                self._index.setdefault(variant, []).append(word)
+
+    def correct(self, token: str) -> str:
+        """Return the closest vocabulary word within the typo budget, or token."""
+        if (token in self._rank or token in self._protected
+                or len(token) < MIN_CORRECTION_LENGTH or not token.isalpha()):
+            return token
+
+        limit = max_edit_distance(token)
+        best, best_key = token, None
+        for variant in _deletes(token, limit):
+            for candidate in self._index.get(variant, ()):
+                distance = edit_distance(token, candidate, limit)
+                if distance > limit or not _within_budget(token, candidate, distance):
+                    continue
+                key = (distance, self._rank[candidate])
+                if best_key is None or key < best_key:
+                    best, best_key = candidate, key
+        return best
+
+    def _normalize(self, query: str) -> str:
+        text = query.lower().replace("u.s.", "us").replace("u.k.", "uk")
+        tokens = [self.correct(token) for token in _TOKEN.findall(text)]
+        normalized = " ".join(tokens)
+        if self._synonym_pattern:
+            normalized = self._synonym_pattern.sub(lambda m: self._synonyms[m.group(1)], normalized)
+        return normalized
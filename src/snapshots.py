@@ -0,0 +1,208 @@
+"""
+Static Snapshot Generator
+=========================
+Pre-renders answers to the most common demo queries as static pages.
+
+The static site (index.html) has no Python runtime, so it can't answer
+queries. This script runs the mapped FRED queries and a curated list of
+IMF queries offline through get_demo_response and writes:
+- snapshots/<slug>.html - standalone answer page with chart
+- snapshots/<slug>.json - answer text, agent and freshness stamp
+- snapshots/index.json  - listing used by index.html
+
+Run on a schedule (see .github/workflows/snapshots.yml):
+    python src/snapshots.py [--output DIR]
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from demo_client import QUERY_MAPPINGS, TIER_FRESH, get_demo_response
+
+# Default output directory, served by the static server at /snapshots/
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / "snapshots"
+
+# Curated international queries answered by Isla from IMF data
+IMF_SNAPSHOT_QUERIES = [
+    "Brazil GDP growth",
+    "China GDP growth",
+    "India GDP growth",
+    "Germany inflation",
+    "Japan inflation",
+    "UK inflation",
+    "France unemployment",
+    "Mexico current account",
+]
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} | Minerva | X-Trillion</title>
+    <meta name="description" content="{description}">
+    <link rel="icon" type="image/png" href="../assets/minerva.png">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            background: linear-gradient(135deg, #0a0a0f 0%, #1a1a2e 50%, #0a0a0f 100%);
+            color: #fff;
+            min-height: 100vh;
+            line-height: 1.6;
+        }}
+        .container {{ max-width: 900px; margin: 0 auto; padding: 30px 20px; }}
+        .back {{ color: #667eea; text-decoration: none; font-size: 0.9rem; }}
+        .question {{
+            background: rgba(102, 126, 234, 0.2);
+            padding: 10px 15px;
+            border-radius: 8px;
+            margin: 20px 0 15px 0;
+        }}
+        .question strong {{ color: #667eea; }}
+        .answer {{ color: #ccc; margin-bottom: 20px; }}
+        .answer p {{ margin-bottom: 10px; }}
+        .answer strong {{ color: #fff; }}
+        .agent {{ color: #888; font-weight: 600; }}
+        .freshness {{ color: #666; font-size: 0.8rem; margin-top: 20px; }}
+        .btn-primary {{
+            display: inline-block;
+            margin-top: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 12px 30px;
+            border-radius: 30px;
+            text-decoration: none;
+            font-weight: 600;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <a href="/" class="back">&larr; X-Trillion</a>
+        <div class="question"><strong>You:</strong> {query}</div>
+        <div class="agent">{agent}:</div>
+        <div class="answer">{answer}</div>
+        {chart}
+        <div class="freshness">Snapshot generated <time datetime="{generated_at}">{generated_label}</time></div>
+        <a href="https://minerva.x-trillion.com" class="btn-primary">Ask Minerva your own question</a>
+    </div>
+</body>
+</html>
+"""
+
+
+def snapshot_queries() -> List[str]:
+    """Return the queries to pre-render: one per mapped FRED series, then IMF."""
+    queries = []
+    seen = set()
+    for keyword, (series_id, _, _, transform, _) in QUERY_MAPPINGS.items():
+        if (series_id, transform) not in seen:
+            seen.add((series_id, transform))
+            queries.append(f"Show me {keyword}")
+    return queries + IMF_SNAPSHOT_QUERIES
+
+
+def slugify(query: str) -> str:
+    """Turn a query into a file-name-safe slug."""
+    return re.sub(r"[^a-z0-9]+", "-", query.lower()).strip("-")
+
+
+def markdown_to_html(text: str) -> str:
+    """Render the small markdown subset used in demo responses."""
+    paragraphs = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        block = html.escape(block)
+        block = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", block)
+        block = re.sub(r"\*(.+?)\*", r"<em>\1</em>", block)
+        paragraphs.append("<p>" + block.replace("\n", "<br>") + "</p>")
+    return "\n".join(paragraphs)
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write a file via rename so the static server never serves half a page."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def render_snapshot(query: str, output_dir: Path) -> Optional[Dict[str, str]]:
+    """Run one query and write its HTML/JSON snapshot.
+
+    Returns the index entry, or None if the query didn't produce a chart
+    from fresh data (the previous snapshot, if any, is left in place).
+    """
+    # Offline run: no deadline, wait for the upstream data
+    text, chart_html, agent_name, tier = get_demo_response(query, deadline=None)
+    if not chart_html or tier != TIER_FRESH:
+        print(f"Snapshot skipped (no data): {query}")
+        return None
+
+    generated = datetime.now(timezone.utc)
+    slug = slugify(query)
+    # The first bold phrase is the series name, e.g. "US Unemployment Rate"
+    headline = re.search(r"\*\*(.+?)\*\*", text)
+    title = headline.group(1) if headline else query
+    entry = {
+        "query": query,
+        "slug": slug,
+        "title": title,
+        "agent": agent_name,
+        "page": f"{slug}.html",
+        "generated_at": generated.isoformat(timespec="seconds"),
+    }
+
+    page = PAGE_TEMPLATE.format(
+        title=html.escape(title),
+        description=html.escape(title, quote=True),
+        query=html.escape(query),
+        agent=html.escape(agent_name),
+        answer=markdown_to_html(text),
+        chart=chart_html,
+        generated_at=entry["generated_at"],
+        generated_label=generated.strftime("%d %B %Y, %H:%M UTC"),
+    )
+    _write_atomic(output_dir / entry["page"], page)
+    _write_atomic(output_dir / f"{slug}.json", json.dumps({**entry, "text": text}, indent=2))
+    return entry
+
+
+def generate_snapshots(output_dir: Path = SNAPSHOT_DIR) -> List[Dict[str, str]]:
+    """Regenerate all snapshots and the index. Returns the index entries."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    entries = []
+
+    for query in snapshot_queries():
+        entry = render_snapshot(query, output_dir)
+        if entry is None:
+            # Keep serving the last good snapshot, with its original stamp
+            previous = output_dir / f"{slugify(query)}.json"
+            if previous.exists():
+                entry = json.loads(previous.read_text(encoding="utf-8"))
+                entry.pop("text", None)
+        if entry is not None:
+            entries.append(entry)
+
+    index = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "snapshots": entries,
+    }
+    _write_atomic(output_dir / "index.json", json.dumps(index, indent=2))
+    return entries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-render demo query snapshots")
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_DIR, help="Output directory")
+    args = parser.parse_args()
+
+    entries = generate_snapshots(args.output)
+    print(f"Wrote {len(entries)} snapshots to {args.output}")
+    sys.exit(0 if entries else 1)
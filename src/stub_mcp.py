@@ -0,0 +1,122 @@
+"""
+Stub MCP Server
+===============
+Local stand-in for the FRED and IMF MCPs, for load testing.
+
+Serves POST /mcp/tools/call with synthetic but correctly shaped
+responses, so the app can be exercised without hitting the real
+workers:
+- fred_series_timeseries: daily (DGS*) or monthly points from start_date
+- imf_*: two-year summary for any country
+
+Point the app at it with FRED_MCP_URL / IMF_MCP_URL:
+    python src/stub_mcp.py --port 8765 [--latency 0.2]
+"""
+
+import argparse
+import json
+import math
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+
+def _timeseries(series_id: str, start_date: str) -> Dict[str, Any]:
+    """Synthetic FRED timeseries result from start_date to today."""
+    try:
+        current = date.fromisoformat(start_date)
+    except ValueError:
+        current = date(date.today().year - 10, 1, 1)
+
+    daily = series_id.startswith("DGS")
+    points: List[Dict[str, str]] = []
+    today = date.today()
+    while current <= today:
+        if not daily or current.weekday() < 5:
+            value = 100 + 10 * math.sin(current.toordinal() / 90) + current.toordinal() / 1000
+            points.append({"date": current.isoformat(), "value": f"{value:.2f}"})
+        if daily:
+            current += timedelta(days=1)
+        else:
+            current = date(current.year + current.month // 12, current.month % 12 + 1, 1)
+
+    return {
+        "series_id": series_id,
+        "title": f"Stub series {series_id}",
+        "units": "Percent",
+        "frequency": "Daily" if daily else "Monthly",
+        "chart_data": points,
+    }
+
+
+def _summary(tool_name: str, country: str) -> Dict[str, Any]:
+    """Synthetic IMF two-year summary."""
+    year = date.today().year
+    return {
+        "title": tool_name.replace("imf_", "").replace("_", " ").title(),
+        "country": country,
+        "previous_year": year - 2,
+        "previous_value": 2.4,
+        "latest_year": year - 1,
+        "latest_value": 3.1,
+        "change": "0.7",
+    }
+
+
+class StubMCPHandler(BaseHTTPRequestHandler):
+    """Answers MCP tool calls with synthetic data after ``latency`` seconds."""
+
+    latency = 0.0
+
+    def do_POST(self):
+        if self.path != "/mcp/tools/call":
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        call = json.loads(self.rfile.read(length) or b"{}")
+        name = call.get("name", "")
+        arguments = call.get("arguments", {})
+
+        if name == "fred_series_timeseries":
+            result = _timeseries(arguments.get("series_id", ""), arguments.get("start_date", ""))
+        elif name.startswith("imf_"):
+            result = _summary(name, arguments.get("country", ""))
+        else:
+            result = None
+
+        envelope = ({"error": f"Unknown tool: {name}"} if result is None
+                    else {"content": [{"type": "text", "text": json.dumps(result)}]})
+        body = json.dumps(envelope).encode("utf-8")
+
+        if self.latency:
+            threading.Event().wait(self.latency)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep load test output readable
+
+
+def start_stub_server(port: int = 0, latency: float = 0.0) -> ThreadingHTTPServer:
+    """Start the stub in a background thread. Returns the server (see server_port)."""
+    handler = type("StubHandler", (StubMCPHandler,), {"latency": latency})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub FRED/IMF MCP server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to delay each response")
+    args = parser.parse_args()
+
+    handler = type("StubHandler", (StubMCPHandler,), {"latency": args.latency})
+    print(f"Stub MCP listening on http://127.0.0.1:{args.port}")
+    ThreadingHTTPServer(("127.0.0.1", args.port), handler).serve_forever()
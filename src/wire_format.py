@@ -0,0 +1,191 @@
+"""
+Binary Wire Format
+==================
+Compact, versioned binary encoding for demo data.
+
+Covers the three objects the demo client produces:
+- FRED series from get_fred_data (DataFrame + series_info)
+- IMF summaries from get_imf_data (two-year comparison dict)
+- chart specs for create_chart (data + title/y_label), a compact
+  alternative to the rendered Plotly HTML for callers that can afford to
+  re-render on load. The app doesn't use them: ResponseStore and the
+  snapshots keep the HTML, since re-rendering costs ~40 ms per rerun
+  while the spec only saves 8-50 KB per stored chart
+
+Layout (little-endian, version 2):
+    header   magic "XTWF", version u16, kind u8, x_unit u8,
+             count u64, meta_len u32                         (20 bytes)
+    meta     UTF-8 JSON object, zero-padded to 8-byte alignment
+    x        count x int64 (dates as ns since epoch, or plain ints)
+    y        count x float64
+
+Arrays are decoded as numpy views over the source buffer, so loading
+from a memoryview or an mmap'd file copies nothing.
+
+Summaries have no arrays (count 0): their four year/value fields are
+kept in the metadata exactly as the MCP returned them, since years like
+"2024E" and missing values don't fit int64/float64 without loss.
+Version 1 packed them into the arrays and is no longer accepted.
+"""
+
+import json
+import mmap
+import struct
+import time
+from typing import Any, Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+WIRE_MAGIC = b"XTWF"
+WIRE_VERSION = 2
+
+# Payload kinds
+KIND_SERIES = 1
+KIND_SUMMARY = 2
+KIND_CHART = 3
+
+# How the x array is interpreted
+X_UNIT_INT = 0
+X_UNIT_NS = 1
+
+_HEADER = struct.Struct("<4sHBBQI")
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class WireFormatError(ValueError):
+    """Raised when a buffer is not a valid payload of the expected kind."""
+
+
+def _pack(kind: int, meta: Dict[str, Any], x: np.ndarray, y: np.ndarray, x_unit: int) -> bytes:
+    """Serialize a header, metadata and the two packed arrays."""
+    x = np.ascontiguousarray(x, dtype="<i8")
+    y = np.ascontiguousarray(y, dtype="<f8")
+    if len(x) != len(y):
+        raise WireFormatError("x and y arrays must have the same length")
+
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    padding = b"\0" * (-(_HEADER.size + len(meta_bytes)) % 8)
+    header = _HEADER.pack(WIRE_MAGIC, WIRE_VERSION, kind, x_unit, len(x), len(meta_bytes))
+    return b"".join([header, meta_bytes, padding, x.tobytes(), y.tobytes()])
+
+
+def _unpack(buf: Buffer, kind: int) -> Tuple[Dict[str, Any], np.ndarray, np.ndarray, int]:
+    """Parse a payload, returning (meta, x, y, x_unit) with zero-copy arrays."""
+    view = memoryview(buf)
+    if len(view) < _HEADER.size:
+        raise WireFormatError("Buffer too short for wire header")
+
+    magic, version, found_kind, x_unit, count, meta_len = _HEADER.unpack_from(view)
+    if magic != WIRE_MAGIC:
+        raise WireFormatError("Not a wire format payload")
+    if version != WIRE_VERSION:
+        raise WireFormatError(f"Unsupported wire format version: {version}")
+    if found_kind != kind:
+        raise WireFormatError(f"Expected payload kind {kind}, found {found_kind}")
+
+    meta_end = _HEADER.size + meta_len
+    x_start = meta_end + (-meta_end % 8)
+    y_start = x_start + 8 * count
+    if len(view) < y_start + 8 * count:
+        raise WireFormatError("Buffer too short for declared point count")
+
+    meta = json.loads(bytes(view[_HEADER.size:meta_end]).decode("utf-8"))
+    x = np.frombuffer(view, dtype="<i8", count=count, offset=x_start)
+    y = np.frombuffer(view, dtype="<f8", count=count, offset=y_start)
+    return meta, x, y, x_unit
+
+
+def _frame(x: np.ndarray, y: np.ndarray) -> pd.DataFrame:
+    """Wrap date/value views in a DataFrame without copying them."""
+    return pd.DataFrame(
+        {"date": x.view("datetime64[ns]"), "value": y},
+        copy=False
+    )
+
+
+def _dates_ns(df: pd.DataFrame) -> np.ndarray:
+    """Return the date column as int64 nanoseconds since epoch."""
+    return df["date"].to_numpy(dtype="datetime64[ns]").view("<i8")
+
+
+def encode_series(df: pd.DataFrame, series_info: Dict[str, str]) -> bytes:
+    """Encode a get_fred_data result."""
+    return _pack(KIND_SERIES, series_info, _dates_ns(df), df["value"].to_numpy(), X_UNIT_NS)
+
+
+def decode_series(buf: Buffer) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    """Decode a series payload back to (df, series_info)."""
+    meta, x, y, _ = _unpack(buf, KIND_SERIES)
+    return _frame(x, y), meta
+
+
+def encode_summary(result: Dict[str, Any]) -> bytes:
+    """Encode a get_imf_data summary, all fields kept as-is in the metadata."""
+    return _pack(KIND_SUMMARY, result, np.empty(0), np.empty(0), X_UNIT_INT)
+
+
+def decode_summary(buf: Buffer) -> Dict[str, Any]:
+    """Decode a summary payload back to the get_imf_data result dict."""
+    meta, _, _, _ = _unpack(buf, KIND_SUMMARY)
+    return meta
+
+
+def encode_chart(df: pd.DataFrame, title: str, y_label: str = "Value") -> bytes:
+    """Encode the inputs of create_chart (line charts only; 2-20x smaller than its HTML)."""
+    meta = {"title": title, "y_label": y_label, "type": "line"}
+    return _pack(KIND_CHART, meta, _dates_ns(df), df["value"].to_numpy(), X_UNIT_NS)
+
+
+def decode_chart(buf: Buffer) -> Tuple[pd.DataFrame, str, str]:
+    """Decode a chart payload to (df, title, y_label) for create_chart."""
+    meta, x, y, _ = _unpack(buf, KIND_CHART)
+    return _frame(x, y), meta["title"], meta["y_label"]
+
+
+def write_file(path: str, payload: bytes) -> None:
+    """Write an encoded payload to disk."""
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
+def map_file(path: str) -> mmap.mmap:
+    """Memory-map an encoded payload for zero-copy decoding.
+
+    The returned mapping must stay open while decoded arrays are in use;
+    the arrays hold a reference to it.
+    """
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+if __name__ == "__main__":
+    # Size/speed comparison against the JSON path (round trips are in tests/)
+    days = pd.date_range("2015-01-01", periods=2500, freq="B")
+    df = pd.DataFrame({"date": days, "value": np.random.default_rng(0).normal(4, 1, len(days))})
+    info = {"title": "10-Year Treasury Rate", "units": "Percent", "frequency": "Daily"}
+    payload = encode_series(df, info)
+
+    # JSON path: chart_data records as returned by the MCP
+    records = [{"date": d.strftime("%Y-%m-%d"), "value": f"{v:.4f}"}
+               for d, v in zip(df["date"], df["value"])]
+    json_payload = json.dumps({**info, "chart_data": records}).encode("utf-8")
+
+    def best_of(fn, repeat=20):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1000
+
+    def json_load():
+        result = json.loads(json_payload)
+        frame = pd.DataFrame(result["chart_data"])
+        frame["date"] = pd.to_datetime(frame["date"])
+        frame["value"] = pd.to_numeric(frame["value"], errors="coerce")
+
+    print(f"Points:       {len(df):,}")
+    print(f"JSON size:    {len(json_payload):,} bytes, load {best_of(json_load):.2f} ms")
+    print(f"Binary size:  {len(payload):,} bytes, load {best_of(lambda: decode_series(payload)):.2f} ms")
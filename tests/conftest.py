@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modules in src/ are imported flat, as app.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,81 @@
+import re
+from datetime import date
+
+import pytest
+
+import demo_client as dc
+from demo_client import months_ago, parse_date_range
+
+
+class FixedDate(date):
+    @classmethod
+    def today(cls):
+        return cls(2025, 3, 14)
+
+
+@pytest.fixture(autouse=True)
+def fixed_today(monkeypatch):
+    monkeypatch.setattr(dc, "date", FixedDate)
+
+
+def test_months_ago_aligns_to_month_start():
+    assert months_ago(0) == date(2025, 3, 1)
+    assert months_ago(3) == date(2024, 12, 1)
+    assert months_ago(24) == date(2023, 3, 1)
+
+
+@pytest.mark.parametrize("query, start, label", [
+    ("unemployment since 2008", date(2008, 1, 1), "since 2008"),
+    ("gdp from 1990", date(1990, 1, 1), "since 1990"),
+    ("inflation over the last 2 years", date(2023, 3, 1), "over the past 2 years"),
+    ("fed funds past 18 months", date(2023, 9, 1), "over the past 18 months"),
+    ("treasury last decade", date(2015, 3, 1), "over the past decade"),
+    ("cpi last year", date(2024, 3, 1), "over the past year"),
+])
+def test_parses_ranges(query, start, label):
+    range_start, period_label, remaining = parse_date_range(query)
+    assert (range_start, period_label) == (start, label)
+    # The range phrase is consumed, the topic is kept
+    assert not re.search(r"\d|since|from|last|past", remaining)
+    assert remaining.split()[0] == query.split()[0]
+
+
+def test_future_year_is_ignored():
+    assert parse_date_range("gdp since 2099") == (None, "", "gdp since 2099")
+
+
+def test_no_range():
+    assert parse_date_range("Show me US inflation") == (None, "", "show me us inflation")
+
+
+def test_range_phrase_is_removed_from_query():
+    _, _, remaining = parse_date_range("unemployment over the last 10 years")
+    assert "10 year" not in remaining and "unemployment" in remaining
+
+
+@pytest.fixture
+def fred_requests(monkeypatch):
+    """Record (series_id, start_date) of FRED fetches without hitting the MCP."""
+    calls = []
+
+    def fake_get_fred_data(series_id, start_date=None):
+        calls.append((series_id, start_date))
+        return None, {}
+
+    monkeypatch.setattr(dc, "get_fred_data", fake_get_fred_data)
+    return calls
+
+
+def test_last_10_years_does_not_route_to_treasury(fred_requests):
+    dc.get_demo_response("unemployment over the last 10 years", deadline=None)
+    assert fred_requests == [("UNRATE", date(2015, 3, 1))]
+
+
+def test_yoy_fetch_starts_a_year_earlier(fred_requests):
+    dc.get_demo_response("inflation since 2010", deadline=None)
+    assert fred_requests == [("CPIAUCSL", date(2009, 1, 1))]
+
+
+def test_default_lookback_per_series(fred_requests):
+    dc.get_demo_response("10 year treasury", deadline=None)
+    assert fred_requests == [("DGS10", date(2023, 3, 1))]
@@ -0,0 +1,151 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import demo_client as dc
+from wire_format import decode_summary, encode_summary
+
+SUMMARY = {"title": "Real GDP Growth", "country": "BRA", "change": "-0.4",
+           "previous_year": 2023, "previous_value": 3.2, "latest_year": 2024, "latest_value": 2.8}
+KEY = ("imf", "BRA", "imf_gdp")
+
+# Budget for fetch_with_deadline: the fresh tier may wait FRESH_WAIT, the
+# rest of the budget goes to the text tier
+RENDER_RESERVE = 0.2
+FRESH_WAIT = 0.1
+
+
+@pytest.fixture(autouse=True)
+def isolated_fetching(monkeypatch):
+    """Fresh pool, cache and in-flight map for every test."""
+    pool = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(dc, "_fetch_pool", pool)
+    monkeypatch.setattr(dc, "FETCH_WORKERS", 4)
+    monkeypatch.setattr(dc, "CHART_RENDER_SECONDS", RENDER_RESERVE)
+    monkeypatch.setattr(dc, "_data_cache", dc.OrderedDict())
+    monkeypatch.setattr(dc, "_in_flight", {})
+    yield
+    pool.shutdown(wait=True)
+
+
+def slow(result, seconds):
+    def fetch():
+        time.sleep(seconds)
+        return result
+    return fetch
+
+
+def fetch(fn, deadline=FRESH_WAIT + RENDER_RESERVE):
+    return dc.fetch_with_deadline(fn, KEY, decode_summary, time.monotonic() + deadline)
+
+
+def test_fresh_tier():
+    data, tier, fetched_at = fetch(slow(SUMMARY, 0))
+    assert (data, tier, fetched_at) == (SUMMARY, dc.TIER_FRESH, None)
+
+
+def test_cached_tier_when_fetch_is_slow():
+    dc._cache_put(KEY, encode_summary(SUMMARY))
+    data, tier, fetched_at = fetch(slow({"stale": False}, 0.5))
+    assert data == SUMMARY and tier == dc.TIER_CACHED and fetched_at is not None
+
+
+def test_text_tier_when_data_arrives_after_render_budget():
+    data, tier, _ = fetch(slow(SUMMARY, FRESH_WAIT + RENDER_RESERVE / 2))
+    assert (data, tier) == (SUMMARY, dc.TIER_TEXT)
+
+
+def test_canned_tier_when_nothing_arrives():
+    data, tier, _ = fetch(slow(SUMMARY, 0.5))
+    assert (data, tier) == (None, dc.TIER_CANNED)
+
+
+def test_no_deadline_waits_for_the_fetch():
+    data, tier, _ = dc.fetch_with_deadline(slow(SUMMARY, 0.4), KEY, decode_summary, None)
+    assert (data, tier) == (SUMMARY, dc.TIER_FRESH)
+
+
+def failing():
+    raise ValueError("bad upstream payload")
+
+
+def test_fetch_error_falls_back_to_cached():
+    dc._cache_put(KEY, encode_summary(SUMMARY))
+    data, tier, _ = fetch(failing)
+    assert (data, tier) == (SUMMARY, dc.TIER_CACHED)
+
+
+def test_fetch_error_without_cache_is_canned():
+    assert fetch(failing)[:2] == (None, dc.TIER_CANNED)
+
+
+def test_concurrent_callers_share_one_fetch():
+    release = threading.Event()
+    calls = []
+
+    def blocking_fetch():
+        calls.append(1)
+        release.wait(5)
+        return SUMMARY
+
+    with ThreadPoolExecutor(max_workers=10) as callers:
+        results = list(callers.map(lambda _: fetch(blocking_fetch), range(10)))
+    assert all(tier == dc.TIER_CANNED for _, tier, _ in results)
+    assert len(dc._in_flight) == 1
+
+    release.set()
+    dc._in_flight[KEY].result(timeout=5)
+    assert len(calls) == 1
+
+    # The done-callback forgets the finished fetch
+    give_up = time.monotonic() + 1
+    while dc._in_flight and time.monotonic() < give_up:
+        time.sleep(0.01)
+    assert dc._in_flight == {}
+
+
+def test_full_queue_skips_the_submit(monkeypatch):
+    monkeypatch.setattr(dc, "FETCH_WORKERS", 1)
+    monkeypatch.setattr(dc, "FETCH_QUEUE_LIMIT", 1)
+    release = threading.Event()
+
+    def blocking_fetch():
+        release.wait(5)
+        return SUMMARY
+
+    first = dc._submit_fetch(blocking_fetch, ("imf", "A", "imf_gdp"))
+    second = dc._submit_fetch(blocking_fetch, ("imf", "B", "imf_gdp"))
+    assert first is not None and second is not None
+
+    skipped = []
+    assert dc._submit_fetch(lambda: skipped.append(1), ("imf", "C", "imf_gdp")) is None
+    # A key already in flight is still shared while the queue is full
+    assert dc._submit_fetch(blocking_fetch, ("imf", "A", "imf_gdp")) is first
+
+    release.set()
+    first.result(timeout=5)
+    second.result(timeout=5)
+    assert skipped == []
+
+
+def test_cached_note_survives_skipped_chart(monkeypatch):
+    monkeypatch.setattr(dc, "get_imf_data", lambda country, tool: (None, None))
+    dc._cache_put(KEY, encode_summary(SUMMARY))
+
+    text, chart_html, agent, tier = dc.get_demo_response("brazil gdp", deadline=0)
+    assert chart_html is None and tier == dc.TIER_CACHED
+    assert "Showing data fetched" in text and "Chart skipped" in text
+
+
+def test_cache_write_failure_keeps_fresh_result(monkeypatch):
+    monkeypatch.setattr(dc, "get_imf_data", lambda country, tool: (dict(SUMMARY), None))
+
+    def broken_encode(result):
+        raise ValueError("cannot encode")
+
+    monkeypatch.setattr(dc, "encode_summary", broken_encode)
+    text, chart_html, agent, tier = dc.get_demo_response("brazil gdp", deadline=None)
+    assert tier == dc.TIER_FRESH and chart_html and "2.8%" in text
+    assert dc._cache_get(KEY) is None
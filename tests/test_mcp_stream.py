@@ -0,0 +1,100 @@
+import json
+import math
+from datetime import date
+
+import pytest
+
+from mcp_stream import MCPError, decode_timeseries, iter_decoded, iter_mcp_text
+
+CHUNK_SIZES = [1, 2, 3, 5, 7, 11, 13, 64, 1024, 64 * 1024]
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def envelope(text: str, ensure_ascii: bool = True) -> bytes:
+    body = {"jsonrpc": "2.0", "id": 1, "meta": {"tags": ["a", {"b": [1, 2.5, None]}]},
+            "content": [{"type": "text", "annotations": {"x": "y\"z"}, "text": text}]}
+    return json.dumps(body, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def mcp_text(data: bytes, size: int) -> str:
+    return "".join(iter_mcp_text(iter_decoded(chunked(data, size))))
+
+
+RESULT = {
+    "series_id": "CPIAUCSL",
+    "title": "Consumer Price Index – \"All Items\"\n\\ é \U0001F4C8 中",
+    "units": "Index 1982-1984=100",
+    "observation_count": 5,
+    "seasonal_adjustment": None,
+    "notes": {"nested": ["skipped", {"deep": True}]},
+    "chart_data": [
+        {"date": "2024-01-01", "value": "308.417"},
+        {"date": "2024-02-01", "value": "."},
+        {"date": "2024-03-01", "value": None},
+        {"value": 312.5, "date": "2024-04-01", "extra": [1, {"x": "é"}]},
+        {"date": "2024-05-01T00:00:00", "value": -1.5e2},
+        {"date": "not a date", "value": "1"},
+    ],
+}
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("inner_ascii, outer_ascii", [(True, True), (False, True), (False, False)])
+def test_envelope_text_matches_json_loads(size, inner_ascii, outer_ascii):
+    data = envelope(json.dumps(RESULT, ensure_ascii=inner_ascii), ensure_ascii=outer_ascii)
+    assert mcp_text(data, size) == json.loads(data)["content"][0]["text"]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_decode_timeseries_at_any_chunk_size(size):
+    data = envelope(json.dumps(RESULT))
+    metadata, days, values = decode_timeseries(iter_mcp_text(iter_decoded(chunked(data, size))))
+
+    assert metadata == {key: value for key, value in RESULT.items()
+                        if not isinstance(value, (dict, list))}
+    epoch = date(1970, 1, 1)
+    assert [epoch.fromordinal(epoch.toordinal() + day) for day in days] == [
+        date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1), date(2024, 4, 1), date(2024, 5, 1),
+    ]
+    assert values[0] == 308.417 and values[3] == 312.5 and values[4] == -150.0
+    # FRED marks missing observations with "."; null is missing too
+    assert math.isnan(values[1]) and math.isnan(values[2])
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", [
+    "\ud800",
+    "a\ud800\nb",
+    "\ud800A",
+    "\udbff\\",
+    "x\udc00y",
+    "\ud800𐀀",
+    "😀\ud83d",
+])
+def test_lone_surrogate_escapes(size, text):
+    data = envelope(text)
+    assert mcp_text(data, size) == json.loads(data)["content"][0]["text"] == text
+
+
+def test_error_envelope_raises_mcp_error():
+    data = json.dumps({"error": "Unknown tool: fred_nope"}).encode("utf-8")
+    with pytest.raises(MCPError, match="Unknown tool: fred_nope"):
+        mcp_text(data, 3)
+
+
+def test_envelope_without_content_yields_nothing():
+    assert mcp_text(b'{"id": 1}', 2) == ""
+    assert mcp_text(b'{"content": []}', 2) == ""
+
+
+@pytest.mark.parametrize("data", [
+    b'{"content": [{"text": "bad \\x escape and then plenty of further text"}]}',
+    b'{"content": [{"text": "unterminated',
+    b'{"content": [{"text": 5}]}',
+])
+def test_malformed_envelopes_raise_value_error(data):
+    with pytest.raises(ValueError):
+        mcp_text(data, 4)
@@ -0,0 +1,135 @@
+import pytest
+
+import payload_budget
+from payload_budget import PayloadMeter, ResponseStore, response_size
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(payload_budget.time, "monotonic", clock)
+    return clock
+
+
+def response(text_size, chart_size=0, query="q"):
+    return ("t" * text_size, "c" * chart_size if chart_size else None, "Fred", query)
+
+
+def assert_total_consistent(store):
+    stats = store.stats()
+    assert stats["stored_bytes"] == sum(entry[1] for entry in store._entries.values())
+    assert stats["stored_bytes"] == sum(response_size(entry[0]) for entry in store._entries.values())
+
+
+def test_response_size_counts_utf8_bytes():
+    assert response_size(("é", None, "ab", "")) == 4
+
+
+def test_put_and_get(clock):
+    store = ResponseStore(session_limit=1000, idle_seconds=60, ceiling=10_000)
+    kept = store.put("a", response(10, 20))
+    assert kept == response(10, 20)
+    assert store.get("a") == kept
+    assert store.get("missing") is None
+    assert_total_consistent(store)
+
+
+def test_session_limit_drops_chart_but_keeps_text(clock):
+    store = ResponseStore(session_limit=100, idle_seconds=60, ceiling=10_000)
+    kept = store.put("a", response(50, 200))
+    assert kept == response(50)
+    assert store.get("a") == response(50)
+    assert store.stats()["charts_dropped"] == 1
+    assert_total_consistent(store)
+
+
+def test_replacing_a_session_response_updates_total(clock):
+    store = ResponseStore(session_limit=1000, idle_seconds=60, ceiling=10_000)
+    store.put("a", response(100, 100))
+    store.put("a", response(30))
+    assert store.stats()["stored_bytes"] == response_size(response(30))
+    store.discard("a")
+    assert store.stats()["stored_bytes"] == 0 and store.stats()["sessions"] == 0
+
+
+def test_idle_sessions_are_evicted(clock):
+    store = ResponseStore(session_limit=1000, idle_seconds=60, ceiling=10_000)
+    store.put("old", response(10))
+    clock.now += 30
+    store.put("recent", response(10))
+    clock.now += 40  # "old" idle for 70s, "recent" for 40s
+
+    assert store.get("old") is None
+    assert store.get("recent") is not None
+    assert store.stats()["evictions"] == 1
+    assert_total_consistent(store)
+
+
+def test_get_refreshes_idle_timer(clock):
+    store = ResponseStore(session_limit=1000, idle_seconds=60, ceiling=10_000)
+    store.put("a", response(10))
+    clock.now += 50
+    assert store.get("a") is not None
+    clock.now += 50
+    assert store.get("a") is not None
+
+
+def test_ceiling_drops_least_recent_charts_first(clock):
+    store = ResponseStore(session_limit=1000, idle_seconds=600, ceiling=700)
+    store.put("a", response(50, 200))
+    store.put("b", response(50, 200))
+    store.get("a")  # "b" is now the least recently used
+    store.put("c", response(50, 200))  # 3 x 251 bytes > 700
+
+    assert store.get("b") == response(50)
+    assert store.get("a") == response(50, 200)
+    assert store.get("c") == response(50, 200)
+    assert store.stats()["charts_dropped"] == 1 and store.stats()["evictions"] == 0
+    assert_total_consistent(store)
+
+
+def test_ceiling_evicts_whole_entries_when_charts_are_not_enough(clock):
+    store = ResponseStore(session_limit=1000, idle_seconds=600, ceiling=250)
+    store.put("a", response(100, 50))
+    store.put("b", response(100, 50))
+    store.put("c", response(100, 50))
+
+    stats = store.stats()
+    assert stats["stored_bytes"] <= 250
+    assert store.get("a") is None  # oldest goes first
+    assert store.get("c") is not None
+    assert stats["charts_dropped"] == 3 and stats["evictions"] == 1
+    assert_total_consistent(store)
+
+
+def test_put_returns_text_only_when_own_entry_is_evicted(clock):
+    store = ResponseStore(session_limit=1000, idle_seconds=600, ceiling=10)
+    assert store.put("a", response(50, 50)) == response(50)
+    assert store.get("a") is None
+    assert store.stats()["stored_bytes"] == 0
+
+
+def test_payload_meter_delta_across_reruns():
+    first = PayloadMeter()
+    first.record("avatar", "a" * 1000)
+    first.record("answer", "hello")
+    assert first.total_bytes() == 1005
+    assert first.delta_bytes() == 1005  # everything is new on the first run
+
+    second = PayloadMeter(first.hashes)
+    assert second.record("avatar", "a" * 1000) == "a" * 1000
+    second.record("answer", "a new answer")
+    assert second.total_bytes() == 1012
+    assert second.delta_bytes() == len("a new answer")
+
+    rows = second.report()
+    assert [row["element"] for row in rows] == ["avatar", "answer"]
+    assert [row["changed"] for row in rows] == [False, True]
@@ -0,0 +1,69 @@
+import pytest
+
+from demo_client import detect_country, detect_indicator, normalize_query
+from query_normalizer import QueryNormalizer, edit_distance
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("inflaton", "inflation"),
+    ("jobless rate", "unemployment"),
+    ("10yr yield", "10 year yield"),
+    ("federal fnuds", "fed funds"),
+    ("Show me U.S. GDP", "show me us gdp"),
+    ("spian inflation", "spain inflation"),
+    ("chna gdp", "china gdp"),
+    ("treasry yeild", "treasury yield"),
+])
+def test_corrects_typos_and_synonyms(query, expected):
+    assert normalize_query(query) == expected
+
+
+@pytest.mark.parametrize("query", [
+    "deflation",
+    "employment in the us",
+    "tell me about china pain",
+    "currency",
+    "india rice exports",
+    "east coast growth over the last year",
+    "oil field output",
+])
+def test_real_words_are_not_corrected(query):
+    assert normalize_query(query) == query
+
+
+def test_two_edit_correction_keeps_first_letter():
+    normalizer = QueryNormalizer(["inflation"])
+    assert normalizer.correct("inflaton") == "inflation"
+    assert normalizer.correct("inflatoin") == "inflation"
+    assert normalizer.correct("deflation") == "deflation"
+
+
+def test_protected_words_are_never_corrected():
+    normalizer = QueryNormalizer(["spain"], protected=["pain"])
+    assert normalizer.correct("pain") == "pain"
+    assert normalizer.correct("spian") == "spain"
+
+
+def test_short_tokens_are_left_alone():
+    assert QueryNormalizer(["uk", "usa"]).correct("us") == "us"
+
+
+def test_edit_distance_counts_transpositions_once():
+    assert edit_distance("fnuds", "funds", 2) == 1
+    assert edit_distance("abcdef", "a", 2) == 3
+
+
+def test_short_words_only_accept_swaps_and_dropped_letters():
+    normalizer = QueryNormalizer(["price", "chile", "cost", "yield", "last", "funds", "china"])
+    assert normalizer.correct("fnuds") == "funds"
+    assert normalizer.correct("chna") == "china"
+    for word in ("rice", "chili", "coast", "field", "east"):
+        assert normalizer.correct(word) == word
+
+
+def test_rice_exports_keep_routing_to_gdp():
+    assert detect_indicator(normalize_query("india rice exports"))[0] == "imf_gdp"
+
+
+def test_chili_is_not_a_country():
+    assert detect_country(normalize_query("chili prices")) is None
@@ -0,0 +1,112 @@
+import struct
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wire_format import (
+    KIND_CHART, WIRE_VERSION, WireFormatError, decode_chart, decode_series,
+    decode_summary, encode_chart, encode_series, encode_summary, map_file, write_file,
+)
+
+
+@pytest.fixture
+def series():
+    days = pd.date_range("2015-01-01", periods=250, freq="B")
+    df = pd.DataFrame({"date": days, "value": np.random.default_rng(0).normal(4, 1, len(days))})
+    info = {"title": "10-Year Treasury Rate", "units": "Percent", "frequency": "Daily"}
+    return df, info
+
+
+def assert_same_points(decoded, df):
+    # Compare values, not dtypes: pandas may pick a different datetime resolution
+    assert list(decoded["date"]) == list(df["date"])
+    assert np.array_equal(decoded["value"], df["value"])
+
+
+def test_series_round_trip(series):
+    df, info = series
+    decoded, decoded_info = decode_series(encode_series(df, info))
+    assert decoded_info == info
+    assert_same_points(decoded, df)
+
+
+def test_empty_series_round_trip():
+    df = pd.DataFrame({"date": pd.to_datetime([]), "value": np.array([], dtype=float)})
+    decoded, info = decode_series(encode_series(df, {"title": "Empty"}))
+    assert len(decoded) == 0 and info == {"title": "Empty"}
+
+
+def test_summary_round_trip():
+    summary = {"title": "Real GDP Growth", "country": "BRA", "change": "-0.4",
+               "previous_year": 2023, "previous_value": 3.2, "latest_year": 2024, "latest_value": 2.8}
+    assert decode_summary(encode_summary(summary)) == summary
+
+
+def test_summary_round_trip_keeps_string_years():
+    summary = {"title": "Inflation Rate", "country": "IND", "change": "0.3",
+               "previous_year": "2024", "previous_value": 4.9, "latest_year": "2025E", "latest_value": 5.2}
+    decoded = decode_summary(encode_summary(summary))
+    assert decoded == summary
+    assert decoded["latest_year"] == "2025E" and decoded["previous_year"] == "2024"
+
+
+def test_summary_round_trip_keeps_missing_values():
+    summary = {"title": "Current Account Balance", "country": "MEX",
+               "previous_year": 2023, "previous_value": -1.1, "latest_year": 2024, "latest_value": None}
+    decoded = decode_summary(encode_summary(summary))
+    # A missing reading must not come back as 0.0
+    assert decoded["latest_value"] is None
+    assert decoded == summary
+
+
+def test_chart_round_trip(series):
+    df, info = series
+    decoded, title, y_label = decode_chart(encode_chart(df, info["title"], "Percent"))
+    assert (title, y_label) == (info["title"], "Percent")
+    assert_same_points(decoded, df)
+
+
+def test_map_file_decodes_without_copying(series, tmp_path):
+    df, info = series
+    path = tmp_path / "series.xtwf"
+    write_file(str(path), encode_series(df, info))
+
+    mapping = map_file(str(path))
+    try:
+        decoded, decoded_info = decode_series(mapping)
+        assert decoded_info == info
+        assert_same_points(decoded, df)
+        # The value column is a view over the mapping, not a copy
+        values = decoded["value"].to_numpy()
+        assert not values.flags.owndata and not values.flags.writeable
+        del decoded, values
+    finally:
+        mapping.close()
+
+
+def test_bad_magic(series):
+    payload = bytearray(encode_series(*series))
+    payload[:4] = b"JSON"
+    with pytest.raises(WireFormatError, match="Not a wire format payload"):
+        decode_series(payload)
+
+
+def test_wrong_version(series):
+    payload = bytearray(encode_series(*series))
+    struct.pack_into("<H", payload, 4, WIRE_VERSION + 1)
+    with pytest.raises(WireFormatError, match="Unsupported wire format version"):
+        decode_series(payload)
+
+
+def test_wrong_kind(series):
+    with pytest.raises(WireFormatError, match=f"Expected payload kind {KIND_CHART}"):
+        decode_chart(encode_series(*series))
+
+
+@pytest.mark.parametrize("length", [0, 10, 40, -1])
+def test_truncated_buffer(series, length):
+    payload = encode_series(*series)
+    with pytest.raises(WireFormatError, match="Buffer too short"):
+        decode_series(payload[:length])
+